@@ -5,6 +5,7 @@ A CLI tool for managing AI prompts stored in markdown files with YAML frontmatte
 
 import json
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -22,7 +23,7 @@ import prompt_butler.services.config as config_module
 from prompt_butler.models import Prompt as PromptModel
 from prompt_butler.services.config import get_config, reload_config
 from prompt_butler.services.migrate import migrate_prompts
-from prompt_butler.services.storage import PromptExistsError, PromptStorage, StorageError
+from prompt_butler.services.storage import PromptExistsError, PromptStorage, StorageError, TagNotFoundError
 
 __version__ = '1.0.0'
 
@@ -30,6 +31,9 @@ __version__ = '1.0.0'
 console = Console()
 error_console = Console(stderr=True)
 
+# Group folder names accepted by `pb group create` and `pb group rename`
+GROUP_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
 # Main Typer app
 app = typer.Typer(
     name='pb',
@@ -241,27 +245,8 @@ def tag_rename(
     storage = PromptStorage()
 
     try:
-        # Get all prompts with the old tag
-        prompts = storage.list_all(tag=old_tag)
-
-        if not prompts:
-            _handle_error(f'No prompts found with tag "{old_tag}".')
-            raise typer.Exit(1)
-
-        # Update each prompt
-        updated_count = 0
-        for prompt in prompts:
-            # Replace the old tag with the new tag
-            new_tags = [new_tag if t == old_tag else t for t in prompt.tags]
-
-            # Skip if tag already renamed (avoid duplicates)
-            if new_tag in prompt.tags and old_tag in prompt.tags:
-                new_tags = [t for t in new_tags if t != old_tag or t == new_tag]
-                new_tags = list(dict.fromkeys(new_tags))  # Remove duplicates
-
-            updated_prompt = prompt.model_copy(update={'tags': new_tags})
-            storage.update(prompt.name, updated_prompt, group=prompt.group)
-            updated_count += 1
+        # Rewrites only the frontmatter of prompts carrying the tag
+        updated_count = storage.rename_tag(old_tag, new_tag)
 
         if state.json_output:
             print(json.dumps({
@@ -274,6 +259,9 @@ def tag_rename(
             console.print(f'[green]✓[/green] Renamed tag [cyan]{old_tag}[/cyan] to [cyan]{new_tag}[/cyan]')
             console.print(f'  [dim]{updated_count} prompt(s) updated.[/dim]')
 
+    except TagNotFoundError:
+        _handle_error(f'No prompts found with tag "{old_tag}".')
+        raise typer.Exit(1) from None
     except StorageError as e:
         _handle_error(str(e))
         raise typer.Exit(1) from e
@@ -321,8 +309,7 @@ def group_create(
     storage = PromptStorage()
 
     # Validate group name
-    import re
-    if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+    if not GROUP_NAME_PATTERN.match(name):
         _handle_error('Group name must contain only alphanumeric characters, underscores, and hyphens.')
         raise typer.Exit(1)
 
@@ -360,8 +347,7 @@ def group_rename(
     storage = PromptStorage()
 
     # Validate new group name
-    import re
-    if not re.match(r'^[a-zA-Z0-9_-]+$', new_name):
+    if not GROUP_NAME_PATTERN.match(new_name):
         _handle_error('Group name must contain only alphanumeric characters, underscores, and hyphens.')
         raise typer.Exit(1)
 
@@ -380,7 +366,7 @@ def group_rename(
 
     try:
         # Count prompts before rename
-        prompt_count = len(list(old_path.glob('*.md')))
+        prompt_count = storage.count_group_prompts(old_name)
 
         # Rename the folder
         old_path.rename(new_path)
@@ -694,10 +680,8 @@ def edit_prompt(
 
         if not file_path.exists():
             # Try to find it by searching
-            for match in storage.prompts_dir.rglob(f'{storage.slugify(name)}.md'):
-                file_path = match
-                break
-            else:
+            file_path = storage._find_prompt_file(name)
+            if file_path is None:
                 _handle_error(f'Prompt file not found for "{name}".')
                 raise typer.Exit(1)
 
@@ -7,7 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from prompt_butler.routers import groups, prompts, tags
-from prompt_butler.services.storage import PromptNotFoundError, StorageError
+from prompt_butler.services.storage import PromptNotFoundError, PromptStorage, StorageError
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info('Starting Prompt Butler API...')
+    PromptStorage.instance().start_warm_up()
     yield
     logger.info('Shutting down Prompt Butler API...')
 
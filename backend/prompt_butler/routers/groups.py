@@ -1,4 +1,4 @@
-import shutil
+import os
 
 from fastapi import APIRouter, HTTPException
 
@@ -7,20 +7,17 @@ from prompt_butler.services.storage import PromptStorage
 
 router = APIRouter(prefix='/api/groups', tags=['groups'])
 
-# Share storage instance with other routers
-_storage = PromptStorage()
-
 
 @router.get('/', response_model=list[GroupCount])
-async def list_groups():
+def list_groups():
     """Get all groups with prompt counts."""
-    group_counts = _storage.get_all_groups()
+    group_counts = PromptStorage.instance().get_all_groups()
 
     return [GroupCount(group=group, count=count) for group, count in sorted(group_counts.items())]
 
 
 @router.post('/rename', response_model=GroupRenameResponse)
-async def rename_group(request: GroupRenameRequest):
+def rename_group(request: GroupRenameRequest):
     """Rename a group, moving all prompts to the new group name.
 
     Args:
@@ -33,8 +30,9 @@ async def rename_group(request: GroupRenameRequest):
         HTTPException 404: If old_group doesn't exist.
         HTTPException 409: If new_group already exists.
     """
-    old_path = _storage.prompts_dir / request.old_group
-    new_path = _storage.prompts_dir / request.new_group
+    storage = PromptStorage.instance()
+    old_path = storage.prompts_dir / request.old_group
+    new_path = storage.prompts_dir / request.new_group
 
     # Check if old group exists
     if not old_path.exists() or not old_path.is_dir():
@@ -45,12 +43,11 @@ async def rename_group(request: GroupRenameRequest):
         raise HTTPException(status_code=409, detail=f'Group "{request.new_group}" already exists')
 
     # Count prompts before moving
-    prompts_in_group = list(old_path.glob('*.md'))
-    count = len(prompts_in_group)
+    count = storage.count_group_prompts(request.old_group)
 
-    # Rename the folder
+    # Rename the folder; both live directly under prompts_dir, so one rename moves every prompt
     try:
-        shutil.move(str(old_path), str(new_path))
+        os.rename(old_path, new_path)
     except OSError as e:
         raise HTTPException(status_code=500, detail=f'Failed to rename group: {e}') from e
 
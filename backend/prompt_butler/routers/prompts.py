@@ -1,34 +1,43 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+
+try:
+    import orjson  # noqa: F401  ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # orjson is an optional extra
+    from fastapi.responses import JSONResponse as DefaultResponse
 
 from prompt_butler.models import Prompt, PromptCreate, PromptResponse, PromptUpdate
 from prompt_butler.services.storage import PromptExistsError, PromptNotFoundError, PromptStorage, StorageError
 
-router = APIRouter(prefix='/api/prompts', tags=['prompts'], responses={404: {'description': 'Prompt not found'}})
-
-# Global storage instance
-_storage = PromptStorage()
+router = APIRouter(
+    prefix='/api/prompts',
+    tags=['prompts'],
+    responses={404: {'description': 'Prompt not found'}},
+    default_response_class=DefaultResponse,
+)
 
 
 @router.get('/', response_model=list[PromptResponse])
-async def list_prompts():
+def list_prompts():
     """List all available prompts with full details."""
     try:
-        return _storage.list_all()
+        # Prompts are serialized on first read and cached, so skip response_model revalidation
+        return Response(content=PromptStorage.instance().list_json(), media_type='application/json')
     except StorageError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
 
 
 @router.get('/{name}', response_model=PromptResponse)
-async def get_prompt(name: str):
+def get_prompt(name: str):
     """Get a specific prompt by name."""
-    prompt = _storage.read(name)
+    prompt = PromptStorage.instance().read(name)
     if prompt is None:
         raise PromptNotFoundError(f'Prompt "{name}" not found')
     return prompt
 
 
 @router.post('/', response_model=PromptResponse, status_code=status.HTTP_201_CREATED)
-async def create_prompt(prompt_data: PromptCreate):
+def create_prompt(prompt_data: PromptCreate):
     """Create a new prompt."""
     prompt = Prompt(
         name=prompt_data.name,
@@ -40,7 +49,7 @@ async def create_prompt(prompt_data: PromptCreate):
     )
 
     try:
-        return _storage.create(prompt)
+        return PromptStorage.instance().create(prompt)
     except PromptExistsError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -49,20 +58,25 @@ async def create_prompt(prompt_data: PromptCreate):
 
 
 @router.put('/{name}', response_model=PromptResponse)
-async def update_prompt(name: str, prompt_update: PromptUpdate):
+def update_prompt(name: str, prompt_update: PromptUpdate):
     """Update an existing prompt."""
-    existing_prompt = _storage.read(name)
+    storage = PromptStorage.instance()
+    existing_prompt = storage.read(name)
     if existing_prompt is None:
         raise PromptNotFoundError(f'Prompt "{name}" not found')
 
-    update_data = prompt_update.model_dump(exclude_unset=True)
-    updated_prompt = existing_prompt.model_copy(update=update_data)
+    # Only the fields sent by the client; avoids a full model_dump for partial updates
+    update_data = {field: getattr(prompt_update, field) for field in prompt_update.model_fields_set}
+    original_group = existing_prompt.group
+    # The PUT body was already validated by PromptUpdate, so assign in place rather than copying
+    for field, value in update_data.items():
+        setattr(existing_prompt, field, value)
 
-    return _storage.update(name, updated_prompt, existing_prompt.group)
+    return storage.update(name, existing_prompt, original_group)
 
 
 @router.delete('/{name}', status_code=status.HTTP_204_NO_CONTENT)
-async def delete_prompt(name: str):
+def delete_prompt(name: str):
     """Delete a prompt."""
-    if not _storage.delete(name):
+    if not PromptStorage.instance().delete(name):
         raise PromptNotFoundError(f'Prompt "{name}" not found')
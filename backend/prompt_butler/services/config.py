@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -5,11 +7,29 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 DEFAULT_PROMPTS_DIR = Path.home() / '.prompts'
 DEFAULT_CONFIG_DIR = Path.home() / '.config' / 'prompt-butler'
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / 'config.yaml'
 
 
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return a file's mtime in nanoseconds, or 0 if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 @dataclass
 class Config:
     """Configuration for Prompt Butler.
@@ -32,18 +52,31 @@ class Config:
     def load(cls, config_path: Optional[Path] = None) -> 'Config':
         """Load configuration from YAML file.
 
+        A sibling config.json written by save() is read instead when the YAML hash
+        stored in it matches the current YAML, so any change to the YAML wins no
+        matter what its mtime says. The JSON is ignored when the YAML is missing.
         Falls back to defaults if file doesn't exist or is invalid.
         """
         path = config_path or DEFAULT_CONFIG_FILE
 
-        if not path.exists():
+        try:
+            with open(path, 'rb') as f:
+                source = f.read()
+        except OSError:
             return cls()
 
         try:
-            with open(path, encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
-        except (OSError, yaml.YAMLError):
-            return cls()
+            with open(path.with_suffix('.json'), 'rb') as f:
+                data = json.loads(f.read())
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict) or data.get('yaml_sha256') != _sha256(source):
+            try:
+                data = yaml.load(source, Loader=SafeLoader)
+            except yaml.YAMLError:
+                return cls()
+        if not isinstance(data, dict):
+            data = {}
 
         prompts_dir = data.get('prompts_dir')
         if prompts_dir:
@@ -62,7 +95,7 @@ class Config:
         )
 
     def save(self, config_path: Optional[Path] = None) -> None:
-        """Save configuration to YAML file."""
+        """Save configuration to YAML file, plus a config.json copy tagged with the YAML's hash."""
         path = config_path or DEFAULT_CONFIG_FILE
 
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -73,8 +106,14 @@ class Config:
             'default_group': self.default_group,
         }
 
-        with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        source = yaml.dump(
+            data, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False
+        ).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(source)
+        # Tagged with the YAML it mirrors; load() ignores it once the YAML changes
+        with open(path.with_suffix('.json'), 'w', encoding='utf-8') as f:
+            json.dump({**data, 'yaml_sha256': _sha256(source)}, f, ensure_ascii=False, indent=2)
 
     def update(self, **kwargs) -> 'Config':
         """Return a new Config with updated values."""
@@ -88,18 +127,30 @@ class Config:
 
 
 _config: Optional[Config] = None
+_config_mtime_ns: tuple[int, int] = (-1, -1)
+
+
+def _config_file_mtime_ns() -> tuple[int, int]:
+    """Return the mtimes of the YAML config and its JSON copy."""
+    return _mtime_ns(DEFAULT_CONFIG_FILE), _mtime_ns(DEFAULT_CONFIG_FILE.with_suffix('.json'))
 
 
 def get_config() -> Config:
-    """Get the global configuration, loading it if necessary."""
-    global _config
-    if _config is None:
+    """Get the global configuration, reloading it if the config file changed.
+
+    The config files are only stat-ed on each call and re-parsed when an mtime moves.
+    """
+    global _config, _config_mtime_ns
+    mtime_ns = _config_file_mtime_ns()
+    if _config is None or mtime_ns != _config_mtime_ns:
         _config = Config.load()
+        _config_mtime_ns = mtime_ns
     return _config
 
 
 def reload_config() -> Config:
     """Force reload the configuration from disk."""
-    global _config
+    global _config, _config_mtime_ns
+    _config_mtime_ns = _config_file_mtime_ns()
     _config = Config.load()
     return _config
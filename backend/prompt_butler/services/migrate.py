@@ -1,11 +1,19 @@
 """Migration service for converting YAML prompts to markdown format."""
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from prompt_butler.models import Prompt
 from prompt_butler.services.storage import PromptExistsError, PromptStorage, StorageError
 
@@ -26,29 +34,43 @@ class MigrationResult:
 
 def migrate_prompts(
     source_dir: Path,
-    target_storage: PromptStorage,
+    target_storage: Optional[PromptStorage] = None,
     on_progress: Optional[Callable[[str, str], None]] = None,
     skip_existing: bool = True,
+    max_workers: int = 16,
+    max_concurrency: int = 8,
 ) -> MigrationResult:
     """Migrate YAML prompts to markdown format.
 
     Args:
         source_dir: Directory containing old YAML prompt files
-        target_storage: PromptStorage instance to write new format
+        target_storage: PromptStorage instance to write new format (defaults to a new PromptStorage)
         on_progress: Optional callback(action, message) for progress updates
         skip_existing: If True, skip prompts that already exist in target
+        max_workers: Maximum number of files read concurrently
+        max_concurrency: Maximum number of in-flight writes to target_storage
 
     Returns:
         MigrationResult with counts and any errors
     """
     result = MigrationResult()
+    # A dedicated instance by default: batch() covers every write to its instance, and the
+    # shared one also takes API writes, which must not wait for this migration's flush()
+    target_storage = target_storage or PromptStorage()
 
     def report(action: str, message: str) -> None:
         if on_progress:
             on_progress(action, message)
 
-    # Find all YAML files in source directory
-    yaml_files = list(source_dir.glob('*.yaml'))
+    # Find all YAML files in source directory (single scandir pass, no per-entry stat)
+    try:
+        with os.scandir(source_dir) as entries:
+            yaml_files = sorted(
+                Path(entry.path) for entry in entries if entry.name.endswith('.yaml') and entry.is_file()
+            )
+    except OSError:
+        # Missing or not a directory: nothing to migrate, as with the old glob
+        yaml_files = []
 
     if not yaml_files:
         report('info', f'No YAML files found in {source_dir}')
@@ -56,35 +78,76 @@ def migrate_prompts(
 
     report('start', f'Found {len(yaml_files)} YAML files to migrate')
 
-    for yaml_file in yaml_files:
+    # Bound in-flight writes separately from readers so a slow backend sees steady load
+    write_slots = threading.BoundedSemaphore(max_concurrency)
+
+    def read_one(yaml_file: Path) -> tuple[str, Union[Prompt, str]]:
         try:
             # Read the old YAML format
             prompt = _read_yaml_prompt(yaml_file)
-            if prompt is None:
-                report('skip', f'{yaml_file.name}: Invalid or empty file')
-                result.skipped_count += 1
-                continue
-
-            # Try to create in new format
+        except (OSError, yaml.YAMLError) as e:
+            return 'error', str(e)
+        if prompt is None:
+            return 'skip', f'{yaml_file.name}: Invalid or empty file'
+        return 'read', prompt
+
+    def write_all(sources: list[tuple[Path, Prompt]]) -> list[tuple[Path, str, str]]:
+        # Sources for one target run in file order, so with overwriting the last one wins
+        outcomes = []
+        for yaml_file, prompt in sources:
             try:
-                target_storage.create(prompt)
-                report('success', f'{prompt.name}: Migrated successfully')
-                result.success_count += 1
-            except PromptExistsError:
-                if skip_existing:
-                    report('skip', f'{prompt.name}: Already exists in target')
-                    result.skipped_count += 1
-                else:
-                    # Overwrite by updating
-                    target_storage.update(prompt.name, prompt, prompt.group)
-                    report('success', f'{prompt.name}: Updated existing')
-                    result.success_count += 1
-
-        except (OSError, yaml.YAMLError, StorageError) as e:
-            error_msg = str(e)
-            report('error', f'{yaml_file.name}: {error_msg}')
-            result.errors.append((yaml_file.name, error_msg))
+                # Try to create in new format
+                with write_slots:
+                    try:
+                        target_storage.create(prompt)
+                        outcomes.append((yaml_file, 'success', f'{prompt.name}: Migrated successfully'))
+                    except PromptExistsError:
+                        if skip_existing:
+                            outcomes.append((yaml_file, 'skip', f'{prompt.name}: Already exists in target'))
+                        else:
+                            # Overwrite by updating
+                            target_storage.update(prompt.name, prompt, prompt.group)
+                            outcomes.append((yaml_file, 'success', f'{prompt.name}: Updated existing'))
+            except (OSError, StorageError) as e:
+                outcomes.append((yaml_file, 'error', str(e)))
+        return outcomes
+
+    def record(yaml_file: Path, action: str, message: str) -> None:
+        if action == 'error':
+            report('error', f'{yaml_file.name}: {message}')
+            result.errors.append((yaml_file.name, message))
             result.failure_count += 1
+        elif action == 'skip':
+            report('skip', message)
+            result.skipped_count += 1
+        else:
+            report('success', message)
+            result.success_count += 1
+
+    # Files are independent and IO-bound, so read/write them on a thread pool. Reads
+    # come first so that sources resolving to the same target prompt can be grouped
+    # and written one after another in sorted order; distinct targets are written in
+    # parallel. Results are consumed in submission order on the calling thread, which
+    # keeps the counters, the progress callback and the outcome deterministic.
+    with target_storage.batch():
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(yaml_files))) as executor:
+            targets: dict[tuple[str, str], list[tuple[Path, Prompt]]] = {}
+            for yaml_file, (action, value) in zip(yaml_files, executor.map(read_one, yaml_files)):
+                if action == 'read':
+                    targets.setdefault((value.group, value.name), []).append((yaml_file, value))
+                else:
+                    record(yaml_file, action, value)
+
+            for outcomes in executor.map(write_all, targets.values()):
+                for yaml_file, action, message in outcomes:
+                    record(yaml_file, action, message)
+
+        # Make the whole batch durable with one sync per touched file and directory
+        try:
+            target_storage.flush()
+        except StorageError as e:
+            report('error', str(e))
+            result.errors.append((str(source_dir), str(e)))
 
     report(
         'done',
@@ -114,7 +177,7 @@ def _read_yaml_prompt(file_path: Path) -> Optional[Prompt]:
     ```
     """
     with open(file_path, encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
 
     if not data or not isinstance(data, dict):
         return None
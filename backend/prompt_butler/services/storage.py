@@ -1,17 +1,44 @@
+import codecs
 import logging
 import os
 import re
+import stat
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-import frontmatter
 import yaml
-from rapidfuzz import fuzz, process
 
 from prompt_butler.models import Prompt
+from prompt_butler.services.config import DEFAULT_PROMPTS_DIR
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
 
 # User prompt separator in markdown files
 USER_PROMPT_SEPARATOR = '---user---'
+# Same boundary rule python-frontmatter's YAMLHandler uses
+FRONTMATTER_BOUNDARY = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+# Metadata-only reads look at this many leading bytes before falling back to the whole file
+FRONTMATTER_READ_SIZE = 4096
+# slugify() patterns: characters to drop, then runs of dashes/whitespace to collapse
+SLUG_STRIP = re.compile(r'[^\w\s-]')
+SLUG_DASHES = re.compile(r'[-\s]+')
+# Maximum number of parsed prompts kept in memory by _read_prompt
+PARSE_CACHE_SIZE = 4096
+# Maximum number of (name, group) -> path entries memoized by _get_prompt_path
+PATH_CACHE_SIZE = 2048
+# Below this many uncached files, list_all parses serially rather than starting a thread pool
+PARALLEL_READ_THRESHOLD = 16
 logger = logging.getLogger(__name__)
 
 
@@ -37,27 +64,73 @@ class PromptStorage:
     """
 
     def __init__(self, prompts_dir: Optional[Path] = None):
-        self.prompts_dir = prompts_dir or Path(os.getenv('PROMPTS_DIR', os.path.expanduser('~/.prompts')))
+        if prompts_dir is None:
+            # DEFAULT_PROMPTS_DIR is resolved once at import instead of expanding ~ per instance
+            env_dir = os.getenv('PROMPTS_DIR')
+            prompts_dir = Path(env_dir) if env_dir is not None else DEFAULT_PROMPTS_DIR
+        self.prompts_dir = prompts_dir
+        # Serialized JSON per file path, keyed on (mtime_ns, size) for list_json()
+        self._json_cache: dict[str, tuple[int, int, tuple[str, str], bytes]] = {}
+        # Bumped by every invalidation, so list_json() never stores a cache built before a write
+        self._json_generation = 0
+        self._json_lock = threading.Lock()
+        # Parsed prompts per file path, keyed on (mtime_ns, size); LRU-bounded to PARSE_CACHE_SIZE
+        self._parse_cache: OrderedDict[str, tuple[int, int, Prompt]] = OrderedDict()
+        self._parse_lock = threading.Lock()
+        # (name, group) -> file path; prompts_dir is fixed after __init__, so entries never go stale
+        self._path_cache: dict[tuple[str, str], Path] = {}
+        # Slug -> file path across all groups, for lookups without a group; see _find_prompt_file()
+        self._name_index: Optional[dict[str, str]] = None
+        # Files written or removed inside a batch() since the last flush(); fsynced together
+        self._dirty_paths: set[str] = set()
+        self._batch_depth = 0
+        self._dirty_lock = threading.Lock()
         self.ensure_prompts_dir()
 
+    @classmethod
+    def instance(cls) -> 'PromptStorage':
+        """Return the shared storage instance used by the API routers.
+
+        Built on the first call, which the routers make per request, so importing
+        this module or the API never touches the prompts directory.
+        """
+        global _storage_service
+        if _storage_service is None:
+            with _storage_service_lock:
+                if _storage_service is None:
+                    _storage_service = cls()
+        return _storage_service
+
     def ensure_prompts_dir(self) -> None:
         """Create prompts directory if it doesn't exist."""
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def slugify(name: str) -> str:
         """Convert a name to a filesystem-safe slug."""
-        slug = re.sub(r'[^\w\s-]', '', name.lower())
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = SLUG_STRIP.sub('', name.lower())
+        slug = SLUG_DASHES.sub('-', slug)
         return slug.strip('-')
 
     def _get_prompt_path(self, name: str, group: str = '') -> Path:
         """Get the file path for a prompt given its name and group."""
+        key = (name, group)
+        file_path = self._path_cache.get(key)
+        if file_path is not None:
+            return file_path
+
         filename = f'{self.slugify(name)}.md'
         normalized_group = self._normalize_group(group)
         if normalized_group:
-            return self.prompts_dir / normalized_group / filename
-        return self.prompts_dir / filename
+            file_path = self.prompts_dir / normalized_group / filename
+        else:
+            file_path = self.prompts_dir / filename
+
+        if len(self._path_cache) >= PATH_CACHE_SIZE:
+            self._path_cache.clear()
+        self._path_cache[key] = file_path
+        return file_path
 
     def _parse_content(self, content: str) -> tuple[str, str]:
         """Parse content into system_prompt and user_prompt.
@@ -78,19 +151,27 @@ class PromptStorage:
             return f'{system_prompt}\n\n{USER_PROMPT_SEPARATOR}\n\n{user_prompt}'
         return system_prompt
 
-    def _derive_group(self, file_path: Path) -> str:
-        """Derive group from parent folder relative to prompts_dir."""
+    def _derive_group(self, file_path: Union[str, Path]) -> str:
+        """Derive group from parent folder relative to prompts_dir.
+
+        Works on the path string, so files found by _prompt_files() never need a Path.
+        relpath() makes both sides absolute first, so a relative prompts_dir such as
+        Path('.') matches the paths built from it.
+        """
         try:
-            relative = file_path.parent.relative_to(self.prompts_dir)
+            relative = os.path.relpath(os.path.dirname(file_path), self.prompts_dir)
         except ValueError:
+            # On another drive (Windows), so not under prompts_dir
             return ''
-
-        if relative == Path('.'):
+        if relative == os.curdir:
+            return ''
+        if relative == os.pardir or relative.startswith(os.pardir + os.sep):
             return ''
-        if len(relative.parts) > 1:
+
+        if os.sep in relative:
             raise ValueError('Nested group paths are not supported')
         try:
-            return self._normalize_group(relative.parts[0])
+            return self._normalize_group(relative)
         except StorageError as exc:
             raise ValueError(str(exc)) from exc
 
@@ -113,11 +194,14 @@ class PromptStorage:
         """
         file_path = self._get_prompt_path(prompt.name, prompt.group)
 
-        # Create group directory if needed
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
         try:
-            self._write_prompt(file_path, prompt, mode='x')
+            # The O_EXCL open is the existence check; only touch the group
+            # directory when the open says it is missing.
+            try:
+                self._write_prompt(file_path, prompt, mode='x')
+            except FileNotFoundError:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                self._write_prompt(file_path, prompt, mode='x')
             return prompt
         except FileExistsError as e:
             raise PromptExistsError(f'Prompt "{prompt.name}" already exists') from e
@@ -133,10 +217,8 @@ class PromptStorage:
 
         if not file_path.exists():
             # Try to find by name across all groups
-            for match in self.prompts_dir.rglob(f'{self.slugify(name)}.md'):
-                file_path = match
-                break
-            else:
+            file_path = self._find_prompt_file(name)
+            if file_path is None:
                 return None
 
         try:
@@ -155,10 +237,8 @@ class PromptStorage:
 
         if not old_path.exists():
             # Try to find by name
-            for match in self.prompts_dir.rglob(f'{self.slugify(name)}.md'):
-                old_path = match
-                break
-            else:
+            old_path = self._find_prompt_file(name)
+            if old_path is None:
                 raise PromptNotFoundError(f'Prompt "{name}" not found')
 
         new_path = self._get_prompt_path(prompt.name, prompt.group)
@@ -167,6 +247,8 @@ class PromptStorage:
             # If path changed (name or group changed), delete old file
             if old_path != new_path:
                 old_path.unlink()
+                self._invalidate(old_path)
+                self._mark_dirty(old_path)
                 new_path.parent.mkdir(parents=True, exist_ok=True)
 
             self._write_prompt(new_path, prompt, mode='w')
@@ -183,14 +265,14 @@ class PromptStorage:
 
         if not file_path.exists():
             # Try to find by name
-            for match in self.prompts_dir.rglob(f'{self.slugify(name)}.md'):
-                file_path = match
-                break
-            else:
+            file_path = self._find_prompt_file(name)
+            if file_path is None:
                 return False
 
         try:
             file_path.unlink()
+            self._invalidate(file_path)
+            self._mark_dirty(file_path)
             return True
         except OSError as e:
             raise StorageError(f'Failed to delete prompt: {e}') from e
@@ -202,23 +284,54 @@ class PromptStorage:
             tag: Filter by tag (exact match)
             group: Filter by group (exact match, empty string for root)
         """
-        prompts = []
+        # The group is the folder, so only that folder is scanned
+        if tag is None:
+            file_paths = self._prompt_files(group)
+        else:
+            # Tags live in the frontmatter, so only files carrying the tag get fully parsed
+            file_paths = [
+                path for path, _, _, tags, _ in self._list_metadata(group) if isinstance(tags, list) and tag in tags
+            ]
+        prompts = self._read_prompts(file_paths)
+
+        # Apply filters
+        if tag is not None:
+            # A file may have been edited since its frontmatter was read
+            prompts = [p for p in prompts if tag in p.tags]
+
+        return sorted(prompts, key=attrgetter('group', 'name'))
+
+    def list_json(self) -> bytes:
+        """Return all prompts as a JSON array, sorted like list_all().
+
+        Each file's serialized JSON is cached against its mtime and size, so
+        unchanged prompts are neither re-parsed nor re-validated.
+        """
+        cache: dict[str, tuple[int, int, tuple[str, str], bytes]] = {}
+        entries = []
+        generation = self._json_generation
 
-        for file_path in self.prompts_dir.rglob('*.md'):
+        for key in self._prompt_files():
             try:
-                prompt = self._read_prompt(file_path)
-                if prompt:
-                    # Apply filters
-                    if tag is not None and tag not in prompt.tags:
-                        continue
-                    if group is not None and prompt.group != group:
-                        continue
-                    prompts.append(prompt)
+                st = os.stat(key)
+                cached = self._json_cache.get(key)
+                if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+                    prompt = self._read_prompt(key)
+                    sort_key = (prompt.group, prompt.name)
+                    cached = (st.st_mtime_ns, st.st_size, sort_key, prompt.model_dump_json().encode())
             except (OSError, ValueError, yaml.YAMLError) as exc:
-                logger.warning('Failed to parse prompt file %s: %s', file_path, exc)
+                logger.warning('Failed to parse prompt file %s: %s', key, exc)
                 continue
+            cache[key] = cached
+            entries.append(cached[2:])
 
-        return sorted(prompts, key=lambda p: (p.group, p.name))
+        # Swap in the fresh cache so entries for deleted files are dropped, unless a
+        # write landed meanwhile and some of these entries may predate it
+        with self._json_lock:
+            if self._json_generation == generation:
+                self._json_cache = cache
+        entries.sort(key=itemgetter(0))
+        return b'[' + b','.join(payload for _, payload in entries) + b']'
 
     def search(self, query: str, limit: int = 10) -> list[Prompt]:
         """Fuzzy search prompts by name and description.
@@ -228,49 +341,86 @@ class PromptStorage:
         if not query:
             return self.list_all()[:limit]
 
-        all_prompts = self.list_all()
+        # Deferred so CLI/TUI startup doesn't load rapidfuzz until someone searches
+        from rapidfuzz import fuzz, process
+
+        # Candidates come from frontmatter only; bodies are read just for the winners
+        entries = self._list_metadata()
 
-        if not all_prompts:
+        if not entries:
             return []
 
         # Create search strings combining name and description
-        search_texts = [f'{p.name} {p.description}' for p in all_prompts]
-
-        # Use rapidfuzz process.extract for fuzzy matching
-        results = process.extract(
-            query,
-            search_texts,
-            scorer=fuzz.WRatio,
-            limit=limit,
-        )
-
-        # Map back to prompts
-        matched_prompts = []
-        for _match_text, score, index in results:
-            if score >= 50:  # Minimum score threshold
-                matched_prompts.append(all_prompts[index])
+        search_texts = [f'{name} {description}' for _, name, description, _, _ in entries]
+
+        # First rank just the top `limit` (a partial sort inside rapidfuzz). Only if
+        # one of those fails to load, rank every candidate above the minimum score
+        # so the next best can take its slot. The cutoff is applied inside rapidfuzz.
+        for ranking_limit in (limit, None):
+            results = process.extract(
+                query,
+                search_texts,
+                scorer=fuzz.WRatio,
+                limit=ranking_limit,
+                score_cutoff=50,
+            )
+
+            # Map back to prompts
+            matched_prompts = []
+            for _match_text, _score, index in results:
+                if len(matched_prompts) >= limit:
+                    break
+                prompt = self._read_prompt_or_none(entries[index][0])
+                if prompt is not None:
+                    matched_prompts.append(prompt)
+
+            if len(matched_prompts) == len(results):
+                break
 
         return matched_prompts
 
+    def stats(self) -> tuple[Counter[str], Counter[str], int]:
+        """Count tags, groups and prompts in a single pass.
+
+        Returns (tag_counts, group_counts, total). Only frontmatter is read,
+        or the parse cache where it is warm; prompt bodies are skipped. Files
+        that list_all() would skip as invalid are not counted.
+        """
+        tag_counts: Counter[str] = Counter()
+        group_counts: Counter[str] = Counter()
+        total = 0
+
+        for _, _, _, tags, group in self._list_metadata():
+            if isinstance(tags, list):
+                tag_counts.update(tags)
+            group_counts[group] += 1
+            total += 1
+
+        return tag_counts, group_counts, total
+
     def get_all_tags(self) -> dict[str, int]:
         """Get all unique tags with usage counts."""
-        tag_counts: dict[str, int] = {}
+        return dict(self.stats()[0])
 
-        for prompt in self.list_all():
-            for tag in prompt.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    def _tag_index(self) -> dict[str, list[str]]:
+        """Map each tag to the prompt files that carry it, from frontmatter only."""
+        index: dict[str, list[str]] = {}
 
-        return tag_counts
+        for file_path, _, _, tags, _ in self._list_metadata():
+            if not isinstance(tags, list):
+                continue
+            for tag in tags:
+                index.setdefault(tag, []).append(file_path)
 
-    def get_all_groups(self) -> dict[str, int]:
-        """Get all groups with prompt counts."""
-        group_counts: dict[str, int] = {}
+        return index
 
-        for prompt in self.list_all():
-            group = prompt.group or ''
-            group_counts[group] = group_counts.get(group, 0) + 1
+    def get_all_groups(self) -> dict[str, int]:
+        """Get all groups with prompt counts.
 
-        return group_counts
+        Groups come from the folder layout; files whose frontmatter would not
+        parse are skipped.
+        """
+        return dict(self.stats()[1])
 
     def rename_tag(self, old_tag: str, new_tag: str) -> int:
         """Rename a tag across all prompts.
@@ -286,55 +436,381 @@ class PromptStorage:
             TagNotFoundError: If no prompts have the old_tag
             StorageError: If file operations fail
         """
-        prompts_with_tag = [p for p in self.list_all() if old_tag in p.tags]
+        tagged_files = self._tag_index().get(old_tag)
 
-        if not prompts_with_tag:
+        if not tagged_files:
             raise TagNotFoundError(f'Tag "{old_tag}" not found')
 
+        # Only files carrying the tag are touched, and only their frontmatter is rewritten
         updated_count = 0
-        for prompt in prompts_with_tag:
-            new_tags = [new_tag if t == old_tag else t for t in prompt.tags]
-            updated_prompt = prompt.model_copy(update={'tags': new_tags})
-            self.update(prompt.name, updated_prompt, prompt.group)
+        for file_path in dict.fromkeys(tagged_files):
+            try:
+                payload = self._retag_content(file_path, old_tag, new_tag)
+            except (OSError, ValueError, yaml.YAMLError) as exc:
+                logger.warning('Failed to parse prompt file %s: %s', file_path, exc)
+                continue
+            if payload is None:
+                # Changed on disk since the index was built
+                continue
+            try:
+                self._replace_file(file_path, payload)
+            except OSError as e:
+                raise StorageError(f'Failed to update prompt: {e}') from e
             updated_count += 1
 
         return updated_count
 
-    def _read_prompt(self, file_path: Path) -> Prompt:
-        """Read and parse a prompt file."""
+    def _retag_content(self, file_path: str, old_tag: str, new_tag: str) -> Optional[str]:
+        """Return a prompt file's text with old_tag renamed in its frontmatter.
+
+        Only the YAML header is regenerated; everything from the closing boundary
+        on is kept verbatim, line endings included. Other headers (e.g. JSON) are
+        parsed by python-frontmatter and the whole prompt is written back out as
+        update() would. Returns None when the file no longer carries old_tag.
+        """
+        with open(file_path, encoding='utf-8', newline='') as f:
+            text = f.read().lstrip()
+
+        opening = FRONTMATTER_BOUNDARY.match(text)
+        closing = opening and FRONTMATTER_BOUNDARY.search(text, opening.end())
+        if not closing:
+            prompt = self._parse_prompt(file_path)
+            if old_tag not in prompt.tags:
+                return None
+            tags = list(dict.fromkeys(new_tag if t == old_tag else t for t in prompt.tags))
+            return self._serialize_prompt(prompt.model_copy(update={'tags': tags}))
+        header = text[opening.end() : closing.start()]
+        metadata = yaml.load(header, Loader=SafeLoader)
+        tags = metadata.get('tags') if isinstance(metadata, dict) else None
+        if not isinstance(tags, list) or old_tag not in tags:
+            return None
+
+        # A prompt that already had new_tag keeps a single copy of it
+        metadata['tags'] = list(dict.fromkeys(new_tag if t == old_tag else t for t in tags))
+        # Same dump options frontmatter.dumps uses, so untouched keys come out the same
+        dumped = yaml.dump(metadata, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True).strip()
+        newline = '\r\n' if '\r\n' in header else '\n'
+        return text[: opening.end()] + '\n' + dumped.replace('\n', newline) + newline + text[closing.start() :]
+
+    def count_group_prompts(self, group: str) -> int:
+        """Count the prompt files directly inside a group folder (0 if it doesn't exist)."""
+        try:
+            with os.scandir(self.prompts_dir / group) as entries:
+                return sum(1 for entry in entries if entry.name.endswith('.md') and entry.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+
+    def warm_up(self) -> None:
+        """Parse every prompt into the parse cache so the first listing is served from memory."""
+        try:
+            self._read_prompts(self._prompt_files())
+        except Exception:
+            # Best effort; the foreground read will surface any real problem
+            logger.debug('Prompt cache warm-up failed', exc_info=True)
+
+    def start_warm_up(self) -> Optional[threading.Thread]:
+        """Run warm_up() on a daemon thread and return it.
+
+        Set PROMPT_BUTLER_WARMUP=0 to skip the warm-up (e.g. for scripts that only
+        touch a single prompt); None is returned then.
+        """
+        if os.getenv('PROMPT_BUTLER_WARMUP') == '0':
+            return None
+        thread = threading.Thread(target=self.warm_up, name='prompt-cache-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def _prompt_files(self, group: Optional[str] = None) -> list[str]:
+        """List every *.md file in prompts_dir and in each group folder directly below it.
+
+        Groups are a single level deep, so two scandir passes replace a recursive
+        glob, and the dirent type saves a stat per entry. Given a group, only that
+        folder is scanned ('' for prompts_dir itself). Paths are the DirEntry
+        strings; callers open them directly without building Path objects.
+        """
+        files: list[str] = []
+        group_dirs: list[str] = []
+        if group:
+            if '/' in group or '\\' in group or group in ('.', '..'):
+                # Not a single folder name, so no prompt can derive this group
+                return files
+            group_dirs.append(str(self.prompts_dir / group))
+        else:
+            try:
+                with os.scandir(self.prompts_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.md'):
+                            if entry.is_file():
+                                files.append(entry.path)
+                        elif group is None and entry.is_dir():
+                            group_dirs.append(entry.path)
+            except FileNotFoundError:
+                return files
+
+        for group_dir in group_dirs:
+            try:
+                with os.scandir(group_dir) as entries:
+                    files.extend(entry.path for entry in entries if entry.name.endswith('.md') and entry.is_file())
+            except (FileNotFoundError, NotADirectoryError):
+                # Removed or replaced while we were walking
+                continue
+
+        return files
+
+    def _find_prompt_file(self, name: str) -> Optional[Path]:
+        """Find a prompt file by name in any group.
+
+        Uses a cached slug -> path index. A hit is checked with a single exists();
+        a miss or a stale hit rebuilds the index from disk, which picks up files
+        added or moved outside this instance. Root prompts win over grouped ones,
+        so a grouped hit is only used while no root file with that slug exists.
+        """
+        slug = self.slugify(name)
+        if self._name_index is not None:
+            file_path = self._name_index.get(slug)
+            if file_path is not None and os.path.exists(file_path):
+                root_path = self._get_prompt_path(name)
+                if file_path != str(root_path) and root_path.exists():
+                    # A root prompt was created after the index was built
+                    self._name_index[slug] = file_path = str(root_path)
+                return Path(file_path)
+
+        index: dict[str, str] = {}
+        for file_path in self._prompt_files():
+            index.setdefault(_stem(file_path), file_path)
+        self._name_index = index
+        file_path = index.get(slug)
+        return Path(file_path) if file_path is not None else None
+
+    def _list_metadata(self, group: Optional[str] = None) -> list[tuple[str, str, str, list, str]]:
+        """Return (path, name, description, tags, group) for every prompt, sorted like list_all().
+
+        Prompts already in the parse cache are taken from it; otherwise only the
+        frontmatter is read, so bodies are never decoded. Files whose name, tags or
+        group would fail Prompt validation are skipped, as list_all() skips them.
+        Given a group, only that folder is scanned.
+        """
+        entries = []
+        for file_path in self._prompt_files(group):
+            try:
+                prompt = self._cached_prompt(file_path, os.stat(file_path))
+                if prompt is None:
+                    # The body isn't read, so validate everything else with an empty one
+                    prompt = self._build_prompt(file_path, self._read_frontmatter(file_path))
+            except (OSError, ValueError, yaml.YAMLError) as exc:
+                logger.warning('Failed to parse prompt file %s: %s', file_path, exc)
+                continue
+            entries.append((file_path, prompt.name, prompt.description, prompt.tags, prompt.group))
+
+        entries.sort(key=lambda entry: (entry[4], str(entry[1])))
+        return entries
+
+    def _read_prompt(self, file_path: Union[str, Path]) -> Prompt:
+        """Read and parse a prompt file.
+
+        Parsed prompts are cached against the file's mtime and size, so an unchanged
+        file costs one stat. Callers get a copy and may modify it freely.
+        """
+        key = str(file_path)
+        st = os.stat(key)
+        prompt = self._cached_prompt(key, st)
+        if prompt is not None:
+            return prompt
+
+        prompt = self._parse_prompt(file_path)
+
+        with self._parse_lock:
+            self._parse_cache[key] = (st.st_mtime_ns, st.st_size, prompt)
+            self._parse_cache.move_to_end(key)
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return _copy_prompt(prompt)
+
+    def _cached_prompt(self, key: str, st: os.stat_result) -> Optional[Prompt]:
+        """Return a copy of the cached prompt for key if it matches st, else None."""
+        with self._parse_lock:
+            cached = self._parse_cache.get(key)
+            if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+                return None
+            self._parse_cache.move_to_end(key)
+        return _copy_prompt(cached[2])
+
+    def _read_prompts(self, file_paths: list[str]) -> list[Prompt]:
+        """Read many prompt files, logging and skipping those that fail.
+
+        Cached prompts are served inline. When at least PARALLEL_READ_THRESHOLD
+        files need parsing, they are read on a thread pool so their IO overlaps.
+        """
+        prompts: list[Prompt] = []
+        misses: list[str] = []
+        for file_path in file_paths:
+            try:
+                prompt = self._cached_prompt(file_path, os.stat(file_path))
+            except OSError as exc:
+                logger.warning('Failed to parse prompt file %s: %s', file_path, exc)
+                continue
+            if prompt is None:
+                misses.append(file_path)
+            else:
+                prompts.append(prompt)
+
+        if len(misses) < PARALLEL_READ_THRESHOLD:
+            parsed = [self._read_prompt_or_none(file_path) for file_path in misses]
+        else:
+            max_workers = min(32, len(misses), (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(self._read_prompt_or_none, misses))
+        prompts.extend(prompt for prompt in parsed if prompt is not None)
+        return prompts
+
+    def _read_prompt_or_none(self, file_path: Union[str, Path]) -> Optional[Prompt]:
+        """Read a prompt file, logging and returning None if it can't be parsed."""
+        try:
+            return self._read_prompt(file_path)
+        except (OSError, ValueError, yaml.YAMLError) as exc:
+            logger.warning('Failed to parse prompt file %s: %s', file_path, exc)
+            return None
+
+    def _parse_prompt(self, file_path: Union[str, Path]) -> Prompt:
+        """Parse a prompt file from disk."""
         with open(file_path, encoding='utf-8') as f:
-            post = frontmatter.load(f)
+            metadata, content = self._load_frontmatter(f.read())
+        return self._build_prompt(file_path, metadata, content)
 
+    def _build_prompt(self, file_path: Union[str, Path], metadata: dict, content: str = '') -> Prompt:
+        """Build a Prompt from a file's frontmatter and content.
+
+        Shared by full parses and frontmatter-only listings so both apply the
+        same defaults and validation.
+        """
         # Parse content into system_prompt and user_prompt
-        system_prompt, user_prompt = self._parse_content(post.content)
+        system_prompt, user_prompt = self._parse_content(content)
 
         # Derive group from folder structure
         group = self._derive_group(file_path)
 
         return Prompt(
-            name=post.metadata.get('name', file_path.stem),
-            description=post.metadata.get('description', ''),
+            name=metadata.get('name', _stem(file_path)),
+            description=metadata.get('description', ''),
             system_prompt=system_prompt,
             user_prompt=user_prompt,
-            tags=post.metadata.get('tags', []),
+            tags=metadata.get('tags', []),
             group=group,
         )
 
+    @classmethod
+    def _load_frontmatter(cls, text: str) -> tuple[dict, str]:
+        """Split a whole prompt file into metadata and content.
+
+        YAML headers take the fast path; anything else (e.g. JSON frontmatter or
+        no header at all) is left to python-frontmatter.
+        """
+        parsed = cls._split_frontmatter(text)
+        if parsed is None:
+            import frontmatter
+
+            post = frontmatter.loads(text)
+            parsed = post.metadata, post.content
+        return parsed
+
+    @staticmethod
+    def _split_frontmatter(text: str) -> Optional[tuple[dict, str]]:
+        """Split text into YAML metadata and content the way frontmatter.loads does.
+
+        Parses the header with the libyaml loader when available. Returns None when
+        the text doesn't open with a YAML boundary.
+        """
+        text = text.replace('\r\n', '\n').strip()
+        if not FRONTMATTER_BOUNDARY.match(text):
+            return None
+        parts = FRONTMATTER_BOUNDARY.split(text, 2)
+        if len(parts) < 3:
+            return {}, text
+
+        metadata = yaml.load(parts[1], Loader=SafeLoader)
+        return (metadata if isinstance(metadata, dict) else {}), parts[2].strip()
+
+    def _read_frontmatter(self, file_path: str) -> dict:
+        """Read only the YAML frontmatter of a prompt file.
+
+        Reads the first FRONTMATTER_READ_SIZE bytes and parses a YAML header from
+        that slice. When the header is longer, or isn't YAML, the whole file goes
+        through _load_frontmatter() so the result matches _parse_prompt().
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(FRONTMATTER_READ_SIZE + 1)
+        truncated = len(head) > FRONTMATTER_READ_SIZE
+
+        if truncated:
+            # Hold back a partial multi-byte character and a possibly partial last line
+            text = codecs.getincrementaldecoder('utf-8')().decode(head[:FRONTMATTER_READ_SIZE])
+            text = text[: text.rfind('\n') + 1]
+        else:
+            text = head.decode('utf-8')
+        text = text.replace('\r\n', '\n').lstrip()
+
+        parts = FRONTMATTER_BOUNDARY.split(text, 2) if FRONTMATTER_BOUNDARY.match(text) else []
+        if len(parts) < 3:
+            if truncated:
+                with open(file_path, encoding='utf-8') as f:
+                    text = f.read()
+            return self._load_frontmatter(text)[0]
+
+        metadata = yaml.load(parts[1], Loader=SafeLoader)
+        return metadata if isinstance(metadata, dict) else {}
+
     def _serialize_prompt(self, prompt: Prompt) -> str:
-        """Serialize a prompt into frontmatter-formatted content."""
+        """Serialize a prompt into frontmatter-formatted content.
+
+        Produces exactly what frontmatter.dumps would (sorted keys, no trailing
+        newline), so files written before and after read back byte-for-byte equal.
+        """
         metadata = {
             'name': prompt.name,
             'description': prompt.description,
             'tags': prompt.tags,
         }
         content = self._format_content(prompt.system_prompt, prompt.user_prompt)
-        post = frontmatter.Post(content, **metadata)
-        return frontmatter.dumps(post)
+        header = yaml.dump(metadata, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True).strip()
+        return f'---\n{header}\n---\n\n{content}'.rstrip()
+
+    def _replace_file(self, file_path: Union[str, Path], payload: str) -> None:
+        """Atomically replace a file's content via a sibling temp file and os.replace.
+
+        Readers see either the old or the new content, never a partial write.
+        An existing file's permission bits are carried over.
+        """
+        directory, filename = os.path.split(file_path)
+        tmp_path = os.path.join(directory, f'.{filename}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            with open(tmp_path, 'x', encoding='utf-8', newline='') as f:
+                f.write(payload)
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, file_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        finally:
+            self._invalidate(file_path)
+        self._mark_dirty(file_path)
 
     def _write_prompt(self, file_path: Path, prompt: Prompt, mode: str = 'w') -> None:
-        """Write a prompt to a file."""
+        """Write a prompt to a file.
+
+        mode='x' creates the file and fails if it exists; 'w' atomically replaces it.
+        """
         payload = self._serialize_prompt(prompt)
-        if mode == 'x':
+        if mode != 'x':
+            self._replace_file(file_path, payload)
+            return
+
+        try:
             # Use O_EXCL for atomic create-if-not-exists.
             fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
             try:
@@ -344,10 +820,97 @@ class PromptStorage:
             finally:
                 if fd is not None:
                     os.close(fd)
-            return
+        finally:
+            # mtime granularity can hide a same-size rewrite, so never trust the caches for our own writes
+            self._invalidate(file_path)
+        self._mark_dirty(file_path)
+
+    def _invalidate(self, file_path: Union[str, Path]) -> None:
+        """Drop any cached parse or JSON for a file we wrote or removed."""
+        key = str(file_path)
+        with self._json_lock:
+            self._json_cache.pop(key, None)
+            self._json_generation += 1
+        with self._parse_lock:
+            self._parse_cache.pop(key, None)
+
+    def _mark_dirty(self, file_path: Union[str, Path]) -> None:
+        """Remember a written or removed file so the next flush() makes it durable.
+
+        Only done inside batch(); outside of one nothing would ever flush the set.
+        """
+        with self._dirty_lock:
+            if self._batch_depth:
+                self._dirty_paths.add(str(file_path))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Track files touched by the writes in this block for a later flush().
+
+        Call flush() before the block ends; paths still pending when the outermost
+        batch exits are dropped so the set cannot grow in long-running processes.
+        The scope covers every write to this instance from any thread, so bulk jobs
+        should batch on their own instance rather than on PromptStorage.instance().
+        """
+        with self._dirty_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._dirty_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._dirty_paths.clear()
 
-        with open(file_path, mode, encoding='utf-8') as f:
-            f.write(payload)
+    def flush(self) -> None:
+        """Fsync every file and directory touched in the current batch since the last flush.
+
+        Individual writes are not fsynced. Bulk callers such as migration write inside
+        batch() and call this once at the end, so each touched file and directory is
+        synced exactly once no matter how many times it was written.
+
+        Raises:
+            StorageError: If a file or directory cannot be synced
+        """
+        with self._dirty_lock:
+            dirty_paths, self._dirty_paths = self._dirty_paths, set()
+
+        try:
+            for file_path in dirty_paths:
+                try:
+                    fd = os.open(file_path, os.O_RDONLY)
+                except FileNotFoundError:
+                    # Deleted or renamed away; syncing its directory records that
+                    continue
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+            if not hasattr(os, 'O_DIRECTORY'):
+                # Directories can't be opened for fsync on Windows
+                return
+            for directory in {os.path.dirname(file_path) for file_path in dirty_paths}:
+                try:
+                    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                except FileNotFoundError:
+                    continue
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        except OSError as e:
+            raise StorageError(f'Failed to flush prompts to disk: {e}') from e
+
+
+def _copy_prompt(prompt: Prompt) -> Prompt:
+    """Copy a cached prompt for a caller; tags is the only mutable field, so it gets its own list."""
+    return prompt.model_copy(update={'tags': list(prompt.tags)})
+
+
+def _stem(file_path: Union[str, Path]) -> str:
+    """Return the filename without its extension, like Path.stem, for a path string."""
+    return os.path.splitext(os.path.basename(file_path))[0]
 
 
 class PromptExistsError(Exception):
@@ -372,3 +935,8 @@ class TagNotFoundError(Exception):
     """Raised when a tag is not found."""
 
     pass
+
+
+# Shared storage instance so every router sees the same prompts directory; see PromptStorage.instance()
+_storage_service: Optional[PromptStorage] = None
+_storage_service_lock = threading.Lock()
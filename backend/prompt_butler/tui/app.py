@@ -5,14 +5,20 @@ Green/amber on dark theme with box-drawing borders.
 """
 
 import base64
-from typing import Optional
-
-from textual import on
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import islice
+from typing import NamedTuple, Optional
+
+import pyperclip
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.coordinate import Coordinate
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -29,6 +35,14 @@ from textual.widgets import (
 from prompt_butler.models import Prompt
 from prompt_butler.services.storage import PromptStorage
 
+# Seconds of typing pause before the search box re-filters the prompt table
+SEARCH_DEBOUNCE_SECONDS = 0.08
+# Narrowing the table removes up to this many rows in place; beyond it a rebuild is cheaper
+# (DataTable.remove_row re-indexes every remaining row)
+MAX_INCREMENTAL_ROW_REMOVALS = 32
+# Splits a comma-separated tags field and trims the whitespace around each comma in one pass
+TAG_SEPARATOR = re.compile(r'\s*,\s*')
+
 # Custom theme colors: green/amber on dark
 THEME_CSS = '''
 Screen {
@@ -211,11 +225,14 @@ DataTable > .datatable--cursor {
 '''
 
 
+# Sidebar and suggestion lists encode the same few group and tag names on every refresh
+@lru_cache(maxsize=1024)
 def _encode_dom_id(value: str) -> str:
     encoded = base64.urlsafe_b64encode(value.encode('utf-8')).decode('ascii').rstrip('=')
     return encoded
 
 
+@lru_cache(maxsize=1024)
 def _decode_dom_id(value: str) -> str:
     padded = value + ('=' * (-len(value) % 4))
     return base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
@@ -225,6 +242,32 @@ def _make_dom_id(prefix: str, value: str) -> str:
     return f'{prefix}-{_encode_dom_id(value)}'
 
 
+class _PromptRow(NamedTuple):
+    """Table-ready data for one prompt, computed once per load."""
+
+    prompt: Prompt
+    key: str
+    cells: tuple[str, str, str, str]
+    # For tag-filter membership checks; prompt.tags is a list
+    tags: frozenset[str]
+    # Casefolded name/description/tags. Newline-joined: the search input is
+    # single-line, so a query can't match across fields.
+    search_text: str
+
+    @classmethod
+    def from_prompt(cls, prompt: Prompt) -> '_PromptRow':
+        description = prompt.description or ''
+        if len(description) > 40:
+            description = description[:37] + '...'
+        return cls(
+            prompt=prompt,
+            key=f'{prompt.group}/{prompt.name}' if prompt.group else prompt.name,
+            cells=(prompt.name, prompt.group or '(root)', description, ', '.join(prompt.tags)),
+            tags=frozenset(prompt.tags),
+            search_text='\n'.join([prompt.name, prompt.description, *prompt.tags]).casefold(),
+        )
+
+
 class RenderableLabel(Label):
     """Label that exposes a renderable property for test compatibility."""
 
@@ -239,6 +282,10 @@ class RenderableLabel(Label):
     def renderable(self) -> str:
         return self._renderable_text
 
+    def update(self, content='', *, layout: bool = True) -> None:
+        self._renderable_text = str(content)
+        super().update(content, layout=layout)
+
 
 class RenderableStatic(Static):
     """Static widget with a stable renderable string for tests."""
@@ -251,6 +298,10 @@ class RenderableStatic(Static):
     def renderable(self) -> str:
         return self._renderable_text
 
+    def update(self, content='', *, layout: bool = True) -> None:
+        self._renderable_text = str(content)
+        super().update(content, layout=layout)
+
 
 class ConfirmDeleteScreen(ModalScreen[bool]):
     """Modal confirmation for deleting a prompt."""
@@ -308,10 +359,27 @@ class HomeScreen(Screen):
         super().__init__(*args, **kwargs)
         self.storage = storage
         self.all_prompts: list[Prompt] = []
+        # Display cells and search text per prompt, aligned with all_prompts
+        self._rows: list[_PromptRow] = []
+        # The same rows per group and per tag, in list order, so filter picks are lookups
+        self._rows_by_group: dict[str, list[_PromptRow]] = {}
+        self._rows_by_tag: dict[str, list[_PromptRow]] = {}
+        # Filter value -> the one after it, for the g/t keys; '' (All) starts each cycle
+        self._next_group: dict[str, str] = {}
+        self._next_tag: dict[str, str] = {}
+        # (group, tag, query, matching rows) from the last search, for refining it
+        self._last_search: Optional[tuple[str, str, str, list[_PromptRow]]] = None
+        # Row keys currently in the table, in order; None forces a full rebuild
+        self._displayed_keys: Optional[list[str]] = None
         self.search_query: str = ''
+        self._search_timer: Optional[Timer] = None
         self.selected_group: str = ''
         self.selected_tag: str = ''
         self._pending_delete: Optional[tuple[str, str]] = None
+        # Sidebar ListItems per list id: dom id -> (item, label, label text)
+        self._filter_items: dict[str, dict[str, tuple[ListItem, Label, str]]] = {}
+        # (group items, tag items) last shown in the sidebar
+        self._sidebar_items: Optional[tuple[list[tuple[str, str]], list[tuple[str, str]]]] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -345,78 +413,147 @@ class HomeScreen(Screen):
 
     def load_filters(self) -> None:
         """Load group and tag filters into sidebar."""
-        group_list = self.query_one('#group-list', ListView)
-        tag_list = self.query_one('#tag-list', ListView)
-
-        group_list.clear()
-        tag_list.clear()
-
-        # Add groups
-        groups = self.storage.get_all_groups()
-        group_list.append(ListItem(Label('All'), id='group-all', classes='filter-item'))
-        for group, count in sorted(groups.items()):
-            display_name = group or '(root)'
-            group_list.append(
-                ListItem(
-                    Label(f'{display_name} ({count})'),
-                    id=_make_dom_id('group', group),
-                    classes='filter-item',
-                )
-            )
+        # Counts come from the prompts load_prompts() already read, not another pass over disk
+        group_items = [('group-all', 'All')]
+        group_items.extend(
+            (_make_dom_id('group', group), f'{group or "(root)"} ({len(rows)})')
+            for group, rows in sorted(self._rows_by_group.items())
+        )
 
-        # Add tags
-        tags = self.storage.get_all_tags()
-        tag_list.append(ListItem(Label('All'), id='tag-all', classes='filter-item'))
-        for tag, count in sorted(tags.items()):
-            tag_list.append(
-                ListItem(Label(f'{tag} ({count})'), id=_make_dom_id('tag', tag), classes='filter-item')
-            )
+        tag_items = [('tag-all', 'All')]
+        tag_items.extend(
+            (_make_dom_id('tag', tag), f'{tag} ({len(rows)})') for tag, rows in sorted(self._rows_by_tag.items())
+        )
+
+        if (group_items, tag_items) == self._sidebar_items:
+            # Most refreshes follow edits that leave the groups, tags and counts as they were
+            return
+        self._sidebar_items = (group_items, tag_items)
+
+        with self.app.batch_update():
+            self._sync_filter_list(self.query_one('#group-list', ListView), group_items)
+            self._sync_filter_list(self.query_one('#tag-list', ListView), tag_items)
+
+    def _sync_filter_list(self, list_view: ListView, items: list[tuple[str, str]]) -> None:
+        """Show items, given as (dom id, label text) in order, in a sidebar list.
+
+        ListItems already shown are kept and relabelled in place when their count
+        changed; only entries that appeared or disappeared are mounted or removed.
+        """
+        current = self._filter_items.get(list_view.id, {})
+        wanted = dict(items)
+        for dom_id, (item, _, _) in current.items():
+            if dom_id not in wanted:
+                item.remove()
+
+        synced: dict[str, tuple[ListItem, Label, str]] = {}
+        # Walk backwards so each run of new items can be mounted in one call, right
+        # before the kept item that follows it (or at the end)
+        following: Optional[ListItem] = None
+        new_items: list[ListItem] = []
+        for dom_id, text in reversed(items):
+            entry = current.get(dom_id)
+            if entry is None:
+                label = Label(text)
+                item = ListItem(label, id=dom_id, classes='filter-item')
+                new_items.append(item)
+            else:
+                item, label, shown = entry
+                if shown != text:
+                    label.update(text)
+                if new_items:
+                    list_view.mount(*reversed(new_items), before=following)
+                    new_items = []
+                following = item
+            synced[dom_id] = (item, label, text)
+        if new_items:
+            list_view.mount(*reversed(new_items), before=following)
+        self._filter_items[list_view.id] = synced
 
     def load_prompts(self) -> None:
         """Load prompts into the data table with filtering."""
         self.all_prompts = self.storage.list_all()
+        # Built once per load so filtering and redrawing never re-derive them
+        self._rows = [_PromptRow.from_prompt(p) for p in self.all_prompts]
+        self._rows_by_group = {}
+        self._rows_by_tag = {}
+        for row in self._rows:
+            self._rows_by_group.setdefault(row.prompt.group, []).append(row)
+            for tag in dict.fromkeys(row.prompt.tags):
+                self._rows_by_tag.setdefault(tag, []).append(row)
+        # '' already stands for "All", so root prompts don't get a stop of their own
+        self._next_group = self._filter_cycle(self._existing_groups())
+        self._next_tag = self._filter_cycle(self._existing_tags())
+        # Rows may show stale data for unchanged keys, so rebuild them all
+        self._displayed_keys = None
+        self._last_search = None
         self.update_table()
 
     def update_table(self) -> None:
-        """Update table with current filters applied."""
+        """Update table with current filters applied.
+
+        Rows are only touched when the filtered set changes. Filters keep the
+        list_all() order, so narrowing the set removes rows in place; anything
+        else rebuilds the table.
+        """
         table = self.query_one('#prompt-list', DataTable)
-        table.clear(columns=True)
-        table.add_columns('Name', 'Group', 'Description', 'Tags')
+        if not table.columns:
+            table.add_columns('Name', 'Group', 'Description', 'Tags')
 
-        filtered = self.all_prompts
+        filtered = self._rows
 
         # Filter by group
         if self.selected_group:
-            if self.selected_group == '(root)':
-                filtered = [p for p in filtered if not p.group]
-            else:
-                filtered = [p for p in filtered if p.group == self.selected_group]
+            group = '' if self.selected_group == '(root)' else self.selected_group
+            filtered = self._rows_by_group.get(group, [])
 
         # Filter by tag
         if self.selected_tag:
-            filtered = [p for p in filtered if self.selected_tag in p.tags]
+            if self.selected_group:
+                filtered = [row for row in filtered if self.selected_tag in row.tags]
+            else:
+                filtered = self._rows_by_tag.get(self.selected_tag, [])
 
         # Filter by search query
         if self.search_query:
-            query = self.search_query.lower()
-            filtered = [
-                p
-                for p in filtered
-                if query in p.name.lower() or query in p.description.lower() or any(query in t.lower() for t in p.tags)
-            ]
-
-        for prompt in filtered:
-            tags = ', '.join(prompt.tags) if prompt.tags else ''
-            description = prompt.description or ''
-            if len(description) > 40:
-                description = description[:37] + '...'
-            table.add_row(
-                prompt.name,
-                prompt.group or '(root)',
-                description,
-                tags,
-                key=f'{prompt.group}/{prompt.name}' if prompt.group else prompt.name,
-            )
+            query = self.search_query.casefold()
+            last = self._last_search
+            if last is not None and last[:2] == (self.selected_group, self.selected_tag) and query.startswith(last[2]):
+                # Typing on only narrows the matches, so rescan just the previous ones
+                filtered = last[3]
+            filtered = [row for row in filtered if query in row.search_text]
+            self._last_search = (self.selected_group, self.selected_tag, query, filtered)
+
+        keys = [row.key for row in filtered]
+        displayed = self._displayed_keys
+        if displayed is not None and keys == displayed:
+            return
+        self._displayed_keys = keys
+
+        # Coalesce the row changes into a single repaint
+        with self.app.batch_update():
+            if not self._remove_missing_rows(table, displayed, keys):
+                table.clear()
+                for row in filtered:
+                    table.add_row(*row.cells, key=row.key)
+            self._reset_cursor(table)
+
+    @staticmethod
+    def _remove_missing_rows(table: DataTable, displayed: Optional[list[str]], keys: list[str]) -> bool:
+        """Narrow the table from displayed to keys in place; False if it needs a rebuild instead."""
+        if displayed is None or len(displayed) - len(keys) > MAX_INCREMENTAL_ROW_REMOVALS:
+            return False
+        kept = set(keys)
+        if not kept.issubset(displayed):
+            return False
+        for key in displayed:
+            if key not in kept:
+                table.remove_row(key)
+        return True
+
+    @staticmethod
+    def _reset_cursor(table: DataTable) -> None:
+        """Move the cursor back to the top if its row is gone."""
         if table.ordered_rows:
             if table.cursor_coordinate.row >= len(table.ordered_rows):
                 table.cursor_coordinate = Coordinate(0, 0)
@@ -427,15 +564,57 @@ class HomeScreen(Screen):
         row_key = str(event.row_key)
         if not row_key:
             return
+        self._show_detail(row_key)
+
+    def _show_detail(self, row_key: str) -> None:
+        """Open the detail screen for the prompt in a table row."""
         name, group = self._split_prompt_key(row_key)
-        self.app.push_screen(DetailScreen(self.storage, name, prompt_group=group))
+        self.app.push_screen(
+            DetailScreen(
+                self.storage,
+                name,
+                prompt_group=group,
+                on_save=lambda _: self.reload(),
+                existing_choices=self._existing_choices,
+            )
+        )
+
+    def _existing_choices(self) -> tuple[list[str], list[str]]:
+        """Tags and groups of the loaded prompts, for an edit screen opened elsewhere."""
+        return self._existing_tags(), self._existing_groups()
+
+    def _existing_tags(self) -> list[str]:
+        """Tags of the loaded prompts, in the order they were first seen."""
+        return list(self._rows_by_tag)
+
+    def _existing_groups(self) -> list[str]:
+        """Named groups of the loaded prompts, leaving out the root."""
+        return [g for g in self._rows_by_group if g]
 
     @on(Input.Changed, '#search-input')
     def on_search_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes for live filtering."""
+        """Handle search input changes for live filtering.
+
+        The table is rebuilt once typing pauses, so a burst of keystrokes costs one filter pass.
+        """
+        if event.value == self.search_query:
+            # e.g. the echo of action_clear_search, which already updated the table
+            return
         self.search_query = event.value
+        self._cancel_pending_search()
+        self._search_timer = self.set_timer(SEARCH_DEBOUNCE_SECONDS, self._run_search)
+
+    def _run_search(self) -> None:
+        """Apply the search query once typing has paused."""
+        self._search_timer = None
         self.update_table()
 
+    def _cancel_pending_search(self) -> None:
+        """Stop a debounced search that hasn't run yet."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+
     @on(ListView.Selected, '#group-list')
     def on_group_selected(self, event: ListView.Selected) -> None:
         """Handle group filter selection."""
@@ -487,8 +666,7 @@ class HomeScreen(Screen):
             return
 
         row_key = str(table.ordered_rows[table.cursor_row].key)
-        name, group = self._split_prompt_key(row_key)
-        self.app.push_screen(DetailScreen(self.storage, name, prompt_group=group))
+        self._show_detail(row_key)
 
     def action_focus_search(self) -> None:
         """Focus the search input."""
@@ -499,36 +677,40 @@ class HomeScreen(Screen):
         search_input = self.query_one('#search-input', Input)
         search_input.value = ''
         self.search_query = ''
+        self._cancel_pending_search()
         self.update_table()
         self.query_one('#prompt-list', DataTable).focus()
 
+    @staticmethod
+    def _filter_cycle(values: list[str]) -> dict[str, str]:
+        """Map '' (All) and each value to the next one, wrapping back to ''."""
+        stops = ['', *values]
+        return dict(zip(stops, stops[1:] + stops[:1]))
+
     def action_cycle_group_filter(self) -> None:
         """Cycle through group filters."""
-        groups = [''] + list(self.storage.get_all_groups().keys())
-        if self.selected_group in groups:
-            idx = groups.index(self.selected_group)
-            self.selected_group = groups[(idx + 1) % len(groups)]
-        else:
-            self.selected_group = ''
+        self.selected_group = self._next_group.get(self.selected_group, '')
         self.update_table()
         group_name = self.selected_group or 'All'
         self.notify(f'Group: {group_name}')
 
     def action_cycle_tag_filter(self) -> None:
         """Cycle through tag filters."""
-        tags = [''] + list(self.storage.get_all_tags().keys())
-        if self.selected_tag in tags:
-            idx = tags.index(self.selected_tag)
-            self.selected_tag = tags[(idx + 1) % len(tags)]
-        else:
-            self.selected_tag = ''
+        self.selected_tag = self._next_tag.get(self.selected_tag, '')
         self.update_table()
         tag_name = self.selected_tag or 'All'
         self.notify(f'Tag: {tag_name}')
 
     def action_add_prompt(self) -> None:
         """Add a new prompt."""
-        self.app.push_screen(AddEditScreen(self.storage, on_save=lambda _: self.load_prompts()))
+        self.app.push_screen(
+            AddEditScreen(
+                self.storage,
+                on_save=lambda _: self.reload(),
+                existing_tags=self._existing_tags(),
+                existing_groups=self._existing_groups(),
+            )
+        )
 
     def action_delete_prompt(self) -> None:
         """Delete the selected prompt."""
@@ -552,18 +734,21 @@ class HomeScreen(Screen):
         self._pending_delete = None
         try:
             if self.storage.delete(name, group=group):
-                self.load_prompts()
-                self.load_filters()
+                self.reload()
                 self.notify(f'Deleted "{name}"')
             else:
                 self.notify('Prompt not found', severity='warning')
         except Exception as exc:
             self.notify(f'Error deleting prompt: {exc}', severity='error')
 
-    def action_refresh(self) -> None:
-        """Refresh the prompt list."""
+    def reload(self) -> None:
+        """Reload prompts from storage and bring the sidebar up to date."""
         self.load_prompts()
         self.load_filters()
+
+    def action_refresh(self) -> None:
+        """Refresh the prompt list."""
+        self.reload()
         self.notify('Refreshed')
 
 
@@ -578,17 +763,40 @@ class DetailScreen(Screen):
         Binding('u', 'copy_user', 'Copy User'),
     ]
 
-    def __init__(self, storage: PromptStorage, prompt_name: str, prompt_group: str = '', *args, **kwargs):
+    def __init__(
+        self,
+        storage: PromptStorage,
+        prompt_name: str,
+        prompt_group: str = '',
+        *args,
+        on_save: Optional[callable] = None,
+        existing_choices: Optional[callable] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.storage = storage
         self.prompt_name = prompt_name
         self.prompt_group = prompt_group
+        self.on_save_callback = on_save
+        # Returns (tags, groups) for the edit screen, which otherwise scans storage for them.
+        # Asked on every edit, so the lists include whatever the previous save added.
+        self.existing_choices = existing_choices
+        # The prompt shown on screen, so the copy actions don't look it up again
+        self.prompt: Optional[Prompt] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
+        # Every section is composed once; load_prompt() fills them in and hides
+        # the ones with nothing to show, so reloading after an edit mounts nothing
         yield VerticalScroll(
             Vertical(
-                RenderableLabel(f'Prompt: {self.prompt_name}', classes='section-title'),
+                RenderableLabel(f'Prompt: {self.prompt_name}', classes='section-title', id='detail-title'),
+                RenderableLabel('Prompt not found', id='detail-missing'),
+                RenderableStatic('', classes='prompt-detail', id='detail-meta'),
+                RenderableLabel('System Prompt:', classes='section-title', id='system-title'),
+                RenderableStatic('', classes='prompt-content', id='system-content'),
+                RenderableLabel('User Prompt:', classes='section-title', id='user-title'),
+                RenderableStatic('', classes='prompt-content', id='user-content'),
                 id='detail-container',
             ),
             id='detail-scroll',
@@ -601,13 +809,15 @@ class DetailScreen(Screen):
 
     def load_prompt(self) -> None:
         """Load and display prompt details."""
-        container = self.query_one('#detail-container', Vertical)
-        container.remove_children()
-        container.mount(RenderableLabel(f'Prompt: {self.prompt_name}', classes='section-title'))
+        self.query_one('#detail-title', RenderableLabel).update(f'Prompt: {self.prompt_name}')
 
-        prompt = self.storage.read(self.prompt_name, self.prompt_group)
+        prompt = self.prompt = self.storage.read(self.prompt_name, self.prompt_group)
+        self.query_one('#detail-missing').display = prompt is None
+        self.query_one('#system-title').display = prompt is not None
         if not prompt:
-            container.mount(RenderableLabel('Prompt not found'))
+            for widget_id in ('detail-meta', 'system-content', 'user-content'):
+                self._show_section(widget_id, '')
+            self.query_one('#user-title').display = False
             return
 
         # Show metadata
@@ -618,18 +828,18 @@ class DetailScreen(Screen):
             meta_lines.append(f'Group: {prompt.group}')
         if prompt.tags:
             meta_lines.append(f'Tags: {", ".join(prompt.tags)}')
+        self._show_section('detail-meta', '\n'.join(meta_lines))
 
-        if meta_lines:
-            container.mount(RenderableStatic('\n'.join(meta_lines), classes='prompt-detail'))
+        # Show system prompt, and the user prompt if present
+        self._show_section('system-content', prompt.system_prompt)
+        self._show_section('user-content', prompt.user_prompt)
+        self.query_one('#user-title').display = bool(prompt.user_prompt)
 
-        # Show system prompt
-        container.mount(RenderableLabel('System Prompt:', classes='section-title'))
-        container.mount(RenderableStatic(prompt.system_prompt, classes='prompt-content'))
-
-        # Show user prompt if present
-        if prompt.user_prompt:
-            container.mount(RenderableLabel('User Prompt:', classes='section-title'))
-            container.mount(RenderableStatic(prompt.user_prompt, classes='prompt-content'))
+    def _show_section(self, widget_id: str, text: str) -> None:
+        """Put text in a detail section, hiding the section when it's empty."""
+        section = self.query_one(f'#{widget_id}', RenderableStatic)
+        section.update(text)
+        section.display = bool(text)
 
     def action_go_back(self) -> None:
         """Go back to home screen."""
@@ -637,12 +847,15 @@ class DetailScreen(Screen):
 
     def action_edit_prompt(self) -> None:
         """Edit the prompt."""
+        existing_tags, existing_groups = self.existing_choices() if self.existing_choices else (None, None)
         self.app.push_screen(
             AddEditScreen(
                 self.storage,
                 self.prompt_name,
                 prompt_group=self.prompt_group,
                 on_save=self.refresh_after_save,
+                existing_tags=existing_tags,
+                existing_groups=existing_groups,
             )
         )
 
@@ -651,31 +864,37 @@ class DetailScreen(Screen):
         self.prompt_name = prompt.name
         self.prompt_group = prompt.group or ''
         self.load_prompt()
+        if self.on_save_callback:
+            self.on_save_callback(prompt)
 
     def action_copy_system(self) -> None:
         """Copy system prompt to clipboard."""
-        prompt = self.storage.read(self.prompt_name)
+        prompt = self.prompt
         if prompt:
-            try:
-                import pyperclip
-                pyperclip.copy(prompt.system_prompt)
-                self.notify('Copied system prompt to clipboard')
-            except Exception:
-                self.notify('Failed to copy to clipboard', severity='error')
+            self._copy_to_clipboard(prompt.system_prompt, 'system prompt')
 
     def action_copy_user(self) -> None:
         """Copy user prompt to clipboard."""
-        prompt = self.storage.read(self.prompt_name)
+        prompt = self.prompt
         if prompt and prompt.user_prompt:
-            try:
-                import pyperclip
-                pyperclip.copy(prompt.user_prompt)
-                self.notify('Copied user prompt to clipboard')
-            except Exception:
-                self.notify('Failed to copy to clipboard', severity='error')
+            self._copy_to_clipboard(prompt.user_prompt, 'user prompt')
         else:
             self.notify('No user prompt to copy', severity='warning')
 
+    @work(thread=True, exclusive=True, group='clipboard')
+    def _copy_to_clipboard(self, text: str, what: str) -> None:
+        """Copy text to the clipboard off the event loop.
+
+        pyperclip shells out to xclip/pbcopy and the like, which can take long
+        enough to stall the UI.
+        """
+        try:
+            pyperclip.copy(text)
+        except Exception:
+            self.app.call_from_thread(self.notify, 'Failed to copy to clipboard', severity='error')
+        else:
+            self.app.call_from_thread(self.notify, f'Copied {what} to clipboard')
+
 
 class AddEditScreen(Screen):
     """Screen for adding or editing a prompt."""
@@ -692,6 +911,8 @@ class AddEditScreen(Screen):
         prompt_group: str = '',
         on_save: Optional[callable] = None,
         *args,
+        existing_tags: Optional[list[str]] = None,
+        existing_groups: Optional[list[str]] = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -700,8 +921,18 @@ class AddEditScreen(Screen):
         self.prompt_group = prompt_group
         self.is_editing = prompt_name is not None
         self.on_save_callback = on_save
-        self.existing_tags = list(storage.get_all_tags().keys())
-        self.existing_groups = [g for g in storage.get_all_groups().keys() if g]
+        if existing_tags is None or existing_groups is None:
+            # Callers that already hold the lists pass them in to skip this pass over disk
+            tag_counts, group_counts, _ = storage.stats()
+            existing_tags = list(tag_counts) if existing_tags is None else existing_tags
+            existing_groups = [g for g in group_counts if g] if existing_groups is None else existing_groups
+        self.existing_tags = existing_tags
+        self.existing_groups = existing_groups
+        # Casefolded once here instead of on every keystroke in the group/tags inputs
+        self._groups_folded = [(g, g.casefold()) for g in self.existing_groups]
+        self._tags_folded = [(t, t.casefold()) for t in self.existing_tags]
+        # Suggestions currently in each suggestion list, by list id
+        self._shown_suggestions: dict[str, tuple[str, ...]] = {}
 
     def compose(self) -> ComposeResult:
         title = f'Edit "{self.prompt_name}"' if self.is_editing else 'New Prompt'
@@ -771,47 +1002,41 @@ class AddEditScreen(Screen):
                 self.query_one('#user-prompt-input', TextArea).text = prompt.user_prompt or ''
 
     @on(Input.Changed, '#group-input')
-    def on_group_changed(self, event: Input.Changed) -> None:
+    async def on_group_changed(self, event: Input.Changed) -> None:
         """Show group suggestions as user types."""
-        suggestions = self.query_one('#group-suggestions', ListView)
-        suggestions.clear()
-
+        matches: Iterable[str] = ()
         if event.value:
-            query = event.value.lower()
-            matches = [g for g in self.existing_groups if query in g.lower()]
-            if matches:
-                for group in matches[:5]:
-                    suggestions.append(ListItem(Label(group), id=_make_dom_id('suggest-group', group)))
-                suggestions.add_class('-visible')
-            else:
-                suggestions.remove_class('-visible')
-        else:
-            suggestions.remove_class('-visible')
+            query = event.value.casefold()
+            matches = (g for g, folded in self._groups_folded if query in folded)
+        await self._show_suggestions(self.query_one('#group-suggestions', ListView), 'suggest-group', matches)
 
     @on(Input.Changed, '#tags-input')
-    def on_tags_changed(self, event: Input.Changed) -> None:
+    async def on_tags_changed(self, event: Input.Changed) -> None:
         """Show tag suggestions for the last tag being typed."""
-        suggestions = self.query_one('#tag-suggestions', ListView)
-        suggestions.clear()
-
+        matches: Iterable[str] = ()
         if event.value:
             # Get the last tag being typed
-            parts = event.value.split(',')
-            current = parts[-1].strip().lower()
+            parts = TAG_SEPARATOR.split(event.value.strip())
+            current = parts[-1].casefold()
 
             if current:
-                already_added = [p.strip() for p in parts[:-1]]
-                matches = [t for t in self.existing_tags if current in t.lower() and t not in already_added]
-                if matches:
-                    for tag in matches[:5]:
-                        suggestions.append(ListItem(Label(tag), id=_make_dom_id('suggest-tag', tag)))
-                    suggestions.add_class('-visible')
-                else:
-                    suggestions.remove_class('-visible')
-            else:
-                suggestions.remove_class('-visible')
-        else:
-            suggestions.remove_class('-visible')
+                already_added = set(parts[:-1])
+                matches = (t for t, folded in self._tags_folded if current in folded and t not in already_added)
+        await self._show_suggestions(self.query_one('#tag-suggestions', ListView), 'suggest-tag', matches)
+
+    async def _show_suggestions(self, suggestions: ListView, id_prefix: str, matches: Iterable[str]) -> None:
+        """Show the first five matches in a suggestion list, hiding it when there are none.
+
+        Matches are consumed lazily, so the scan stops at the fifth. The list's
+        items are only rebuilt when the five shown values change.
+        """
+        shown = tuple(islice(matches, 5))
+        if shown != self._shown_suggestions.get(suggestions.id, ()):
+            self._shown_suggestions[suggestions.id] = shown
+            # Wait for the old items to go, since a value still shown reuses its id
+            await suggestions.clear()
+            suggestions.extend(ListItem(Label(value), id=_make_dom_id(id_prefix, value)) for value in shown)
+        suggestions.set_class(bool(shown), '-visible')
 
     @on(ListView.Selected, '#group-suggestions')
     def on_group_suggestion_selected(self, event: ListView.Selected) -> None:
@@ -862,7 +1087,7 @@ class AddEditScreen(Screen):
             return
 
         # Parse tags
-        tags = [t.strip() for t in tags_str.split(',') if t.strip()] if tags_str else []
+        tags = [t for t in TAG_SEPARATOR.split(tags_str) if t] if tags_str else []
 
         # Create prompt object
         prompt = Prompt(
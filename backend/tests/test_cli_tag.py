@@ -128,6 +128,24 @@ class TestTagRename:
         assert 'coding' in prompt1.tags  # Original tag preserved
         assert 'py' in prompt1.tags  # New tag added
 
+    def test_tag_rename_merges_into_existing_tag(self, runner, storage_with_tagged_prompts):
+        result = runner.invoke(app, ['tag', 'rename', 'python', 'coding'])
+
+        assert result.exit_code == 0
+        assert storage_with_tagged_prompts.read('prompt1').tags == ['coding']
+        assert storage_with_tagged_prompts.read('prompt2').tags == ['coding', 'testing']
+
+    def test_tag_rename_json_frontmatter_prompt(self, runner, storage_with_tagged_prompts, tmp_path):
+        (tmp_path / 'json-prompt.md').write_text('{\n"name": "json-prompt",\n"tags": ["legacy"]\n}\n\nSystem')
+
+        listed = runner.invoke(app, ['list', '--tag', 'legacy'])
+        result = runner.invoke(app, ['tag', 'rename', 'legacy', 'modern'])
+
+        assert 'json-prompt' in listed.output
+        assert result.exit_code == 0
+        assert '1 prompt(s) updated' in result.output
+        assert storage_with_tagged_prompts.read('json-prompt').tags == ['modern']
+
     def test_tag_rename_json_output(self, runner, storage_with_tagged_prompts):
         result = runner.invoke(app, ['--json', 'tag', 'rename', 'python', 'py'])
 
@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 from unittest.mock import patch
@@ -105,6 +106,46 @@ class TestConfigSave:
         assert loaded.editor == 'code'
         assert loaded.default_group == 'work'
 
+    def test_save_writes_json_copy(self, tmp_path):
+        config_file = tmp_path / 'config.yaml'
+        Config(default_group='work').save(config_file)
+
+        json_file = tmp_path / 'config.json'
+        data = json.loads(json_file.read_text())
+        assert data['default_group'] == 'work'
+        # Still tagged with the current YAML's hash, so load() reads the JSON
+        json_file.write_text(json.dumps({**data, 'default_group': 'from-json'}))
+
+        assert Config.load(config_file).default_group == 'from-json'
+
+    def test_load_prefers_changed_yaml_over_newer_json(self, tmp_path):
+        config_file = tmp_path / 'config.yaml'
+        Config(default_group='saved').save(config_file)
+
+        # An older YAML restored with its mtime preserved, as cp -p or rsync would
+        config_file.write_text('default_group: restored\n')
+        json_stat = (tmp_path / 'config.json').stat()
+        os.utime(config_file, ns=(json_stat.st_atime_ns, json_stat.st_mtime_ns - 1_000_000_000))
+
+        assert Config.load(config_file).default_group == 'restored'
+
+    def test_load_prefers_yaml_when_mtimes_tie(self, tmp_path):
+        config_file = tmp_path / 'config.yaml'
+        Config(default_group='saved').save(config_file)
+
+        config_file.write_text('default_group: hand-edited\n')
+        json_stat = (tmp_path / 'config.json').stat()
+        os.utime(config_file, ns=(json_stat.st_atime_ns, json_stat.st_mtime_ns))
+
+        assert Config.load(config_file).default_group == 'hand-edited'
+
+    def test_load_ignores_json_without_yaml(self, tmp_path):
+        config_file = tmp_path / 'config.yaml'
+        Config(default_group='saved').save(config_file)
+        config_file.unlink()
+
+        assert Config.load(config_file).default_group == ''
+
 
 class TestConfigUpdate:
     def test_update_returns_new_config(self):
@@ -153,3 +194,23 @@ class TestGlobalConfig:
 
         assert config2.default_group == 'updated'
         assert config2 is not config1
+
+    def test_get_config_reloads_when_file_changes(self, tmp_path, monkeypatch):
+        import prompt_butler.services.config as config_module
+
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text('default_group: initial\n')
+        monkeypatch.setattr(config_module, 'DEFAULT_CONFIG_FILE', config_file)
+        config_module._config = None
+
+        config1 = get_config()
+        assert config1.default_group == 'initial'
+        assert get_config() is config1
+
+        config_file.write_text('default_group: updated\n')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        config2 = get_config()
+        assert config2.default_group == 'updated'
+        assert config2 is not config1
@@ -136,6 +136,57 @@ class TestMigratePrompts:
         assert result.success_count == 3
         assert result.failure_count == 0
 
+    def test_migrate_duplicate_names_with_overwrite(self, tmp_path):
+        source_dir = tmp_path / 'source'
+        target_dir = tmp_path / 'target'
+        source_dir.mkdir()
+        target_dir.mkdir()
+
+        # Several source files resolve to the same target prompt
+        for i in range(8):
+            (source_dir / f'copy{i}.yaml').write_text(
+                yaml.dump({
+                    'name': 'shared',
+                    'system_prompt': f'Content {i}',
+                })
+            )
+
+        storage = PromptStorage(prompts_dir=target_dir)
+        progress = []
+
+        def on_progress(action, message):
+            progress.append((action, message))
+
+        result = migrate_prompts(source_dir, storage, on_progress, skip_existing=False, max_workers=4)
+
+        assert result.success_count == 8
+        assert result.failure_count == 0
+        # The last source in sorted order wins, and progress follows that order
+        assert storage.read('shared').system_prompt == 'Content 7'
+        expected = [('success', 'shared: Migrated successfully')] + [('success', 'shared: Updated existing')] * 7
+        assert progress[1:-1] == expected
+
+    def test_migrate_default_target_leaves_shared_storage_unbatched(self, tmp_path, monkeypatch):
+        from prompt_butler.services import storage as storage_module
+
+        source_dir = tmp_path / 'source'
+        source_dir.mkdir()
+        (source_dir / 'one.yaml').write_text(yaml.dump({'name': 'one', 'system_prompt': 'Content'}))
+        shared = PromptStorage(prompts_dir=tmp_path / 'shared')
+        monkeypatch.setattr(storage_module, '_storage_service', shared)
+        monkeypatch.setenv('PROMPTS_DIR', str(tmp_path / 'target'))
+
+        depths = []
+
+        def on_progress(action, message):
+            depths.append(shared._batch_depth)
+
+        result = migrate_prompts(source_dir, on_progress=on_progress)
+
+        assert result.success_count == 1
+        assert set(depths) == {0}
+        assert PromptStorage(prompts_dir=tmp_path / 'target').read('one') is not None
+
     def test_migrate_preserves_all_fields(self, tmp_path):
         source_dir = tmp_path / 'source'
         target_dir = tmp_path / 'target'
@@ -280,6 +331,24 @@ class TestMigratePrompts:
 
         assert result.total_processed == 0
 
+    def test_migrate_missing_or_file_source(self, tmp_path):
+        target_dir = tmp_path / 'target'
+        target_dir.mkdir()
+        not_a_dir = tmp_path / 'file.yaml'
+        not_a_dir.write_text('name: x')
+
+        storage = PromptStorage(prompts_dir=target_dir)
+        for source in (tmp_path / 'missing', not_a_dir):
+            progress_calls = []
+
+            def on_progress(action: str, message: str, calls=progress_calls) -> None:
+                calls.append((action, message))
+
+            result = migrate_prompts(source, storage, on_progress=on_progress)
+
+            assert result.total_processed == 0
+            assert progress_calls == [('info', f'No YAML files found in {source}')]
+
     def test_migrate_calls_progress_callback(self, tmp_path):
         source_dir = tmp_path / 'source'
         target_dir = tmp_path / 'target'
@@ -1,9 +1,32 @@
+import json
 import logging
+import os
+from pathlib import Path
 
 import pytest
 
-from prompt_butler.models import Prompt
-from prompt_butler.services.storage import PromptExistsError, PromptNotFoundError, PromptStorage
+from prompt_butler.models import PROMPT_MAX_LENGTH, Prompt
+from prompt_butler.services import storage as storage_module
+from prompt_butler.services.storage import (
+    PromptExistsError,
+    PromptNotFoundError,
+    PromptStorage,
+    StorageError,
+    TagNotFoundError,
+)
+
+
+def _record_parses(storage: PromptStorage, monkeypatch) -> list[str]:
+    """Spy on storage._parse_prompt; returns the list it appends each parsed file's name to."""
+    parsed = []
+    real_parse = storage._parse_prompt
+
+    def parse(path):
+        parsed.append(os.path.basename(path))
+        return real_parse(path)
+
+    monkeypatch.setattr(storage, '_parse_prompt', parse)
+    return parsed
 
 
 class TestPromptStorageSlugify:
@@ -63,6 +86,94 @@ class TestPromptStorageFormatContent:
         assert content == 'System prompt'
 
 
+class TestPromptStorageSerializePrompt:
+    @pytest.mark.parametrize(
+        'prompt',
+        [
+            Prompt(name='minimal', system_prompt='Content'),
+            Prompt(
+                name='full',
+                description='Ünïcode: yes',
+                system_prompt='Sys\n',
+                user_prompt='User',
+                tags=['a', 'b c'],
+            ),
+            Prompt(name='empty-body', description='', system_prompt='', tags=[]),
+        ],
+    )
+    def test_matches_frontmatter_dumps(self, tmp_path, prompt):
+        import frontmatter
+
+        storage = PromptStorage(prompts_dir=tmp_path)
+        content = storage._format_content(prompt.system_prompt, prompt.user_prompt)
+        post = frontmatter.Post(content, name=prompt.name, description=prompt.description, tags=prompt.tags)
+
+        assert storage._serialize_prompt(prompt) == frontmatter.dumps(post)
+
+
+class TestPromptStorageInit:
+    def test_prompts_dir_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('PROMPTS_DIR', str(tmp_path / 'from-env'))
+
+        storage = PromptStorage()
+
+        assert storage.prompts_dir == tmp_path / 'from-env'
+        assert storage.prompts_dir.is_dir()
+
+    def test_shared_instance_is_created_on_first_use(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('PROMPTS_DIR', str(tmp_path / 'shared'))
+        monkeypatch.setattr(storage_module, '_storage_service', None)
+        assert not (tmp_path / 'shared').exists()
+
+        shared = PromptStorage.instance()
+
+        assert shared is PromptStorage.instance()
+        assert shared.prompts_dir.is_dir()
+
+
+class TestPromptStorageGetPromptPath:
+    def test_paths_are_memoized(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        first = storage._get_prompt_path('My Prompt', 'coding')
+
+        assert first == tmp_path / 'coding' / 'my-prompt.md'
+        assert storage._get_prompt_path('My Prompt', 'coding') is first
+
+    def test_invalid_group_raises_every_time(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        for _ in range(2):
+            with pytest.raises(StorageError):
+                storage._get_prompt_path('p', 'a/b')
+
+
+class TestPromptStorageDeriveGroup:
+    def test_derive_group_from_path_strings(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        assert storage._derive_group(os.path.join(str(tmp_path), 'root.md')) == ''
+        assert storage._derive_group(os.path.join(str(tmp_path), 'coding', 'a.md')) == 'coding'
+        assert storage._derive_group(tmp_path / 'coding' / 'a.md') == 'coding'
+        assert storage._derive_group(os.path.join(str(tmp_path.parent), 'other.md')) == ''
+
+    def test_derive_group_with_relative_prompts_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        storage = PromptStorage(prompts_dir=Path('.'))
+        storage.create(Prompt(name='x', system_prompt='Content', group='h'))
+        storage.create(Prompt(name='y', system_prompt='Content'))
+
+        assert storage.read('x', 'h').group == 'h'
+        assert [(p.group, p.name) for p in storage.list_all()] == [('', 'y'), ('h', 'x')]
+        assert storage.get_all_groups() == {'': 1, 'h': 1}
+
+    def test_derive_group_rejects_nested_folders(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        with pytest.raises(ValueError):
+            storage._derive_group(os.path.join(str(tmp_path), 'coding', 'nested', 'a.md'))
+
+
 class TestPromptStorageCreate:
     def test_create_prompt_in_root(self, tmp_path):
         storage = PromptStorage(prompts_dir=tmp_path)
@@ -184,6 +295,71 @@ class TestPromptStorageRead:
         assert result is not None
         assert result.group == 'coding'
 
+    def test_read_across_groups_follows_external_moves(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='moving', system_prompt='C', group='coding'))
+        assert storage.read('moving').group == 'coding'
+
+        (tmp_path / 'writing').mkdir()
+        (tmp_path / 'coding' / 'moving.md').rename(tmp_path / 'writing' / 'moving.md')
+        (tmp_path / 'writing' / 'added.md').write_text('---\nname: added\n---\nC')
+
+        assert storage.read('moving').group == 'writing'
+        assert storage.read('added').group == 'writing'
+
+
+    def test_read_across_groups_prefers_root_created_later(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='shared', system_prompt='Grouped', group='coding'))
+        assert storage.read('shared', 'writing').group == 'coding'
+
+        storage.create(Prompt(name='shared', system_prompt='Root'))
+
+        assert storage.read('shared', 'writing').system_prompt == 'Root'
+
+class TestPromptStorageParseCache:
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='cached', system_prompt='Content'))
+        storage.read('cached')
+
+        def fail(file_path):
+            raise AssertionError('file was re-parsed')
+
+        monkeypatch.setattr(storage, '_parse_prompt', fail)
+
+        assert storage.read('cached').system_prompt == 'Content'
+        assert [p.name for p in storage.list_all()] == ['cached']
+
+    def test_external_edit_is_picked_up(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='edited', system_prompt='Before'))
+        storage.read('edited')
+
+        file_path = tmp_path / 'edited.md'
+        file_path.write_text('---\nname: edited\n---\n\nAfter, and longer')
+
+        assert storage.read('edited').system_prompt == 'After, and longer'
+
+    def test_returned_prompt_is_a_copy(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='copy', system_prompt='Original'))
+
+        storage.read('copy').system_prompt = 'Changed in memory'
+
+        assert storage.read('copy').system_prompt == 'Original'
+
+    def test_returned_tags_are_a_copy(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='copy', system_prompt='Original', tags=['a']))
+
+        storage.read('copy').tags.append('first-read')
+        storage.read('copy').tags.append('cached-read')
+        storage.list_all()[0].tags.append('listed')
+
+        assert storage.read('copy').tags == ['a']
+        assert storage.get_all_tags() == {'a': 1}
+
 
 class TestPromptStorageUpdate:
     def test_update_existing_prompt(self, tmp_path):
@@ -200,6 +376,19 @@ class TestPromptStorageUpdate:
         read_back = storage.read('test')
         assert read_back.system_prompt == 'Updated'
 
+    def test_update_replaces_file_atomically(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='test', system_prompt='Original'))
+        file_path = tmp_path / 'test.md'
+        file_path.chmod(0o600)
+        inode = file_path.stat().st_ino
+
+        storage.update('test', Prompt(name='test', system_prompt='Updated'))
+
+        assert file_path.stat().st_ino != inode
+        assert file_path.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ['test.md']
+
     def test_update_nonexistent_raises_error(self, tmp_path):
         storage = PromptStorage(prompts_dir=tmp_path)
         prompt = Prompt(name='nonexistent', system_prompt='Test')
@@ -271,6 +460,17 @@ class TestPromptStorageListAll:
 
         assert result == []
 
+    def test_list_ignores_files_below_group_level(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='top', system_prompt='C', group='coding'))
+        (tmp_path / 'coding' / 'nested').mkdir()
+        (tmp_path / 'coding' / 'nested' / 'deep.md').write_text('---\nname: deep\n---\nC')
+        (tmp_path / 'notes.txt').write_text('not a prompt')
+
+        result = storage.list_all()
+
+        assert [p.name for p in result] == ['top']
+
     def test_list_all_prompts(self, tmp_path):
         storage = PromptStorage(prompts_dir=tmp_path)
         storage.create(Prompt(name='prompt1', system_prompt='Content 1'))
@@ -313,6 +513,30 @@ class TestPromptStorageListAll:
         assert len(result) == 1
         assert result[0].name == 'prompt2'
 
+    def test_list_filter_by_group_reads_only_that_folder(self, tmp_path, monkeypatch):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='prompt1', system_prompt='Content', group='coding'))
+        storage.create(Prompt(name='prompt2', system_prompt='Content', group='writing'))
+        storage.create(Prompt(name='prompt3', system_prompt='Content'))
+        storage = PromptStorage(prompts_dir=tmp_path)
+        parsed = _record_parses(storage, monkeypatch)
+
+        assert [p.name for p in storage.list_all(group='coding')] == ['prompt1']
+        assert parsed == ['prompt1.md']
+        assert storage.list_all(group='coding/..') == []
+
+    def test_list_filter_by_tag_reads_only_tagged_files(self, tmp_path, monkeypatch):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='prompt1', system_prompt='Content', tags=['python']))
+        storage.create(Prompt(name='prompt2', system_prompt='Content', tags=['rust'], group='coding'))
+        storage.create(Prompt(name='prompt3', system_prompt='Content', tags=['python'], group='coding'))
+        storage = PromptStorage(prompts_dir=tmp_path)
+        parsed = _record_parses(storage, monkeypatch)
+
+        assert [p.name for p in storage.list_all(tag='python')] == ['prompt1', 'prompt3']
+        assert sorted(parsed) == ['prompt1.md', 'prompt3.md']
+        assert [p.name for p in storage.list_all(tag='python', group='coding')] == ['prompt3']
+
     def test_list_sorted_by_group_then_name(self, tmp_path):
         storage = PromptStorage(prompts_dir=tmp_path)
         storage.create(Prompt(name='zebra', system_prompt='Content', group=''))
@@ -337,6 +561,69 @@ class TestPromptStorageListAll:
         assert any('Failed to parse prompt file' in record.message for record in caplog.records)
         assert any(prompt.name == 'good' for prompt in result)
 
+    def test_list_many_uncached_files(self, tmp_path):
+        (tmp_path / 'bad.md').write_text('---\nname: [\n---\ncontent')
+        for i in range(40):
+            group_dir = tmp_path / f'group{i % 4}'
+            group_dir.mkdir(exist_ok=True)
+            (group_dir / f'p{i:02d}.md').write_text(f'---\nname: p{i:02d}\n---\n\nContent {i}')
+
+        result = PromptStorage(prompts_dir=tmp_path).list_all()
+
+        assert len(result) == 40
+        assert [p.group for p in result] == sorted(p.group for p in result)
+        assert result[0].name == 'p00' and result[0].system_prompt == 'Content 0'
+
+
+class TestPromptStorageListJson:
+    def test_list_json_matches_list_all(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='zebra', system_prompt='Content', group=''))
+        storage.create(Prompt(name='apple', system_prompt='Content', group='coding', tags=['one']))
+
+        data = json.loads(storage.list_json())
+
+        assert data == [p.model_dump() for p in storage.list_all()]
+
+    def test_list_json_reflects_updates_and_deletes(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='prompt1', system_prompt='Before'))
+        storage.create(Prompt(name='prompt2', system_prompt='Content'))
+        storage.list_json()
+
+        storage.update('prompt1', Prompt(name='prompt1', system_prompt='Afterr'))
+        storage.delete('prompt2')
+
+        data = json.loads(storage.list_json())
+
+        assert [p['name'] for p in data] == ['prompt1']
+        assert data[0]['system_prompt'] == 'Afterr'
+
+
+    def test_list_json_drops_cache_built_across_a_write(self, tmp_path, monkeypatch):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='prompt1', system_prompt='Before'))
+        storage.create(Prompt(name='prompt2', system_prompt='Content'))
+        path = tmp_path / 'prompt1.md'
+        st = path.stat()
+        real_read = storage._read_prompt
+
+        def read_then_write(file_path):
+            prompt = real_read(file_path)
+            if str(file_path) == str(path) and prompt.system_prompt == 'Before':
+                # Another request rewrites prompt1 with the same size and mtime mid-build
+                storage.update('prompt1', Prompt(name='prompt1', system_prompt='Afterr'))
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            return prompt
+
+        monkeypatch.setattr(storage, '_read_prompt', read_then_write)
+        storage.list_json()
+        monkeypatch.setattr(storage, '_read_prompt', real_read)
+
+        data = json.loads(storage.list_json())
+
+        assert data[0]['system_prompt'] == 'Afterr'
+
 
 class TestPromptStorageSearch:
     def test_search_by_name(self, tmp_path):
@@ -359,6 +646,17 @@ class TestPromptStorageSearch:
         assert len(result) >= 1
         assert any(p.name == 'prompt1' for p in result)
 
+    def test_search_by_description_in_json_frontmatter(self, tmp_path):
+        (tmp_path / 'prompt1.md').write_text('{\n"description": "Reviews Python code"\n}\n\nContent')
+        (tmp_path / 'prompt2.md').write_text('{\n"description": "Writes documentation"\n}\n\nContent')
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        entries = storage._list_metadata()
+        result = storage.search('python')
+
+        assert [entry[2] for entry in entries] == ['Reviews Python code', 'Writes documentation']
+        assert result[0].name == 'prompt1'
+
     def test_search_fuzzy_match(self, tmp_path):
         storage = PromptStorage(prompts_dir=tmp_path)
         storage.create(Prompt(name='code-review', system_prompt='Content'))
@@ -369,6 +667,12 @@ class TestPromptStorageSearch:
         assert len(result) >= 1
         assert any(p.name == 'code-review' for p in result)
 
+    def test_search_drops_weak_matches(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='code-review', system_prompt='Content'))
+
+        assert storage.search('xqzvj') == []
+
     def test_search_empty_query_returns_all(self, tmp_path):
         storage = PromptStorage(prompts_dir=tmp_path)
         storage.create(Prompt(name='prompt1', system_prompt='Content'))
@@ -387,6 +691,46 @@ class TestPromptStorageSearch:
 
         assert len(result) <= 3
 
+    def test_search_reads_bodies_only_for_matches(self, tmp_path, monkeypatch):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='code-review', system_prompt='Review body'))
+        storage.create(Prompt(name='poem-writer', system_prompt='Poem body'))
+        # Fresh instance so nothing is in the parse cache yet
+        storage = PromptStorage(prompts_dir=tmp_path)
+        parsed = _record_parses(storage, monkeypatch)
+
+        result = storage.search('code review')
+
+        assert [p.system_prompt for p in result] == ['Review body']
+        assert parsed == ['code-review.md']
+
+    def test_search_skips_matches_that_fail_to_load(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        # Valid frontmatter, so it is ranked, but the body is over the length limit
+        (tmp_path / 'broken.md').write_text('---\nname: code-review\n---\n' + 'x' * (PROMPT_MAX_LENGTH + 1))
+        storage.create(Prompt(name='code-review', system_prompt='Content', group='coding'))
+
+        result = storage.search('code review', limit=1)
+
+        assert [(p.group, p.name) for p in result] == [('coding', 'code-review')]
+
+    def test_search_ranks_only_the_top_matches(self, tmp_path, monkeypatch):
+        from rapidfuzz import process
+
+        storage = PromptStorage(prompts_dir=tmp_path)
+        for i in range(5):
+            storage.create(Prompt(name=f'prompt{i}', system_prompt='Content'))
+        limits = []
+        real_extract = process.extract
+        monkeypatch.setattr(
+            process, 'extract', lambda *args, **kwargs: limits.append(kwargs['limit']) or real_extract(*args, **kwargs)
+        )
+
+        result = storage.search('prompt', limit=2)
+
+        assert len(result) == 2
+        assert limits == [2]
+
 
 class TestPromptStorageGetAllTags:
     def test_get_all_tags_empty(self, tmp_path):
@@ -408,6 +752,171 @@ class TestPromptStorageGetAllTags:
         assert result['python'] == 1
         assert result['writing'] == 1
 
+    def test_get_all_tags_with_long_body(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='prompt1', system_prompt='x' * 10000, tags=['big']))
+
+        assert storage.get_all_tags() == {'big': 1}
+
+    def test_get_all_tags_with_frontmatter_larger_than_read_size(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='prompt1', description='d' * 5000, system_prompt='Content', tags=['late']))
+
+        assert storage.get_all_tags() == {'late': 1}
+
+    def test_counts_match_list_all_for_json_frontmatter(self, tmp_path):
+        (tmp_path / 'coding').mkdir()
+        (tmp_path / 'coding' / 'json-prompt.md').write_text(
+            '{\n"name": "json-prompt",\n"description": "From JSON",\n"tags": ["x"]\n}\n\nBody'
+        )
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        tag_counts, group_counts, total = storage.stats()
+
+        assert storage.list_all()[0].tags == ['x']
+        assert (tag_counts, group_counts, total) == ({'x': 1}, {'coding': 1}, 1)
+
+    def test_get_all_tags_skips_unparseable_file(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        (tmp_path / 'bad.md').write_text('---\nname: [\n---\ncontent')
+        storage.create(Prompt(name='good', system_prompt='Content', tags=['ok']))
+
+        assert storage.get_all_tags() == {'ok': 1}
+
+    def test_counts_skip_files_that_fail_validation(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='good', system_prompt='Content', tags=['alpha']))
+        (tmp_path / 'g').mkdir()
+        invalid = tmp_path / 'g' / 'bad.md'
+        invalid.write_text('---\nname: bad name!\ntags:\n- alpha\n---\nContent')
+        original = invalid.read_bytes()
+
+        assert [p.name for p in storage.list_all()] == ['good']
+        assert storage.stats() == ({'alpha': 1}, {'': 1}, 1)
+        assert storage.get_all_tags() == {'alpha': 1}
+        assert storage.get_all_groups() == {'': 1}
+        assert storage.rename_tag('alpha', 'beta') == 1
+        assert invalid.read_bytes() == original
+
+
+class TestPromptStorageRenameTag:
+    def test_rename_tag_rewrites_only_tagged_prompts(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='p1', system_prompt='C', tags=['old', 'keep'], group='coding'))
+        storage.create(Prompt(name='p2', system_prompt='C', tags=['other']))
+        untouched = (tmp_path / 'p2.md').read_bytes()
+
+        updated = storage.rename_tag('old', 'new')
+
+        assert updated == 1
+        assert storage.read('p1', 'coding').tags == ['new', 'keep']
+        assert (tmp_path / 'p2.md').read_bytes() == untouched
+        assert not list(tmp_path.rglob('*.tmp'))
+
+    def test_rename_tag_keeps_body_bytes(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        body = b'\r\n  Hand-written body\r\n\r\n---user---\r\nUser part  \r\n'
+        (tmp_path / 'manual.md').write_bytes(b'---\r\nauthor: me\r\nname: manual\r\ntags:\r\n- old\r\n---' + body)
+
+        assert storage.rename_tag('old', 'new') == 1
+
+        content = (tmp_path / 'manual.md').read_bytes()
+        assert content.endswith(b'\r\n---' + body)
+        assert b'author: me' in content
+        assert storage.read('manual').tags == ['new']
+
+    def test_rename_tag_in_json_frontmatter(self, tmp_path):
+        (tmp_path / 'coding').mkdir()
+        (tmp_path / 'coding' / 'json-prompt.md').write_text(
+            '{\n"name": "json-prompt",\n"tags": ["x", "keep"]\n}\n\nSystem\n\n---user---\n\nUser'
+        )
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        assert storage.rename_tag('x', 'y') == 1
+
+        prompt = storage.read('json-prompt', 'coding')
+        assert (prompt.tags, prompt.system_prompt, prompt.user_prompt) == (['y', 'keep'], 'System', 'User')
+        assert storage.get_all_tags() == {'y': 1, 'keep': 1}
+
+    def test_rename_missing_tag_raises(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='p1', system_prompt='C', tags=['one']))
+
+        with pytest.raises(TagNotFoundError):
+            storage.rename_tag('missing', 'new')
+
+
+class TestPromptStorageWarmUp:
+    def test_warm_up_fills_parse_cache(self, tmp_path, monkeypatch):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='prompt1', system_prompt='Content'))
+        storage.create(Prompt(name='prompt2', system_prompt='Content', group='coding'))
+        storage = PromptStorage(prompts_dir=tmp_path)
+        monkeypatch.delenv('PROMPT_BUTLER_WARMUP', raising=False)
+
+        storage.start_warm_up().join()
+        parsed = _record_parses(storage, monkeypatch)
+
+        assert [p.name for p in storage.list_all()] == ['prompt1', 'prompt2']
+        assert parsed == []
+
+    def test_warm_up_disabled_by_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('PROMPT_BUTLER_WARMUP', '0')
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        assert storage.start_warm_up() is None
+
+
+class TestPromptStorageFlush:
+    def test_flush_syncs_each_touched_path_once(self, tmp_path, monkeypatch):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        prompt = Prompt(name='p1', system_prompt='C', group='coding')
+
+        synced = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, 'fsync', lambda fd: synced.append(fd) or real_fsync(fd))
+        with storage.batch():
+            storage.create(prompt)
+            storage.update('p1', prompt, 'coding')
+            storage.create(Prompt(name='p2', system_prompt='C'))
+            storage.delete('p2')
+            storage.flush()
+
+            # p1 once, plus the coding and root directories; deleted p2 is skipped
+            assert len(synced) == 3
+
+            synced.clear()
+            storage.flush()
+            assert synced == []
+
+    def test_writes_outside_batch_are_not_tracked(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+
+        storage.create(Prompt(name='p1', system_prompt='C'))
+        assert storage._dirty_paths == set()
+
+        with storage.batch():
+            with storage.batch():
+                storage.create(Prompt(name='p2', system_prompt='C'))
+            assert len(storage._dirty_paths) == 1
+
+        # Unflushed paths are dropped once the outermost batch ends
+        assert storage._dirty_paths == set()
+
+
+class TestPromptStorageStats:
+    def test_stats_counts_tags_groups_and_total(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='p1', system_prompt='C', tags=['a', 'b'], group='coding'))
+        storage.create(Prompt(name='p2', system_prompt='C', tags=['a']))
+        storage.create(Prompt(name='p3', system_prompt='C', group='coding'))
+
+        tag_counts, group_counts, total = storage.stats()
+
+        assert tag_counts == {'a': 2, 'b': 1}
+        assert group_counts == {'coding': 2, '': 1}
+        assert total == 3
+
 
 class TestPromptStorageGetAllGroups:
     def test_get_all_groups_empty(self, tmp_path):
@@ -429,6 +938,17 @@ class TestPromptStorageGetAllGroups:
         assert result[''] == 1
 
 
+class TestPromptStorageCountGroupPrompts:
+    def test_counts_only_prompt_files(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        storage.create(Prompt(name='p1', system_prompt='C', group='coding'))
+        storage.create(Prompt(name='p2', system_prompt='C', group='coding'))
+        (tmp_path / 'coding' / 'notes.txt').write_text('not a prompt')
+
+        assert storage.count_group_prompts('coding') == 2
+        assert storage.count_group_prompts('missing') == 0
+
+
 class TestPromptStorageFileFormat:
     def test_file_has_correct_frontmatter(self, tmp_path):
         storage = PromptStorage(prompts_dir=tmp_path)
@@ -468,3 +988,16 @@ class TestPromptStorageFileFormat:
         assert result.user_prompt == original.user_prompt
         assert result.tags == original.tags
         assert result.group == original.group
+
+    def test_read_hand_written_files(self, tmp_path):
+        storage = PromptStorage(prompts_dir=tmp_path)
+        (tmp_path / 'crlf.md').write_bytes(
+            b'---\r\nname: crlf\r\ntags: [a]\r\n---\r\n\r\nSystem\r\n---user---\r\nUser\r\n'
+        )
+        (tmp_path / 'plain.md').write_text('Just a body, no frontmatter')
+
+        crlf = storage.read('crlf')
+        plain = storage.read('plain')
+
+        assert (crlf.name, crlf.tags, crlf.system_prompt, crlf.user_prompt) == ('crlf', ['a'], 'System', 'User')
+        assert (plain.name, plain.system_prompt) == ('plain', 'Just a body, no frontmatter')
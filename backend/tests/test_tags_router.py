@@ -8,13 +8,12 @@ from prompt_butler.models import Prompt
 @pytest.fixture
 def client(tmp_path, monkeypatch):
     """Create test client with isolated storage."""
+    from prompt_butler.services import storage as storage_module
     from prompt_butler.services.storage import PromptStorage
 
     test_storage = PromptStorage(prompts_dir=tmp_path)
 
-    import prompt_butler.routers.tags as tags_router
-
-    monkeypatch.setattr(tags_router, '_storage', test_storage)
+    monkeypatch.setattr(storage_module, '_storage_service', test_storage)
 
     return TestClient(app), test_storage
 
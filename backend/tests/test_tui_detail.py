@@ -160,7 +160,7 @@ class TestDetailScreen:
 
             with patch('pyperclip.copy') as mock_copy:
                 await pilot.press('c')
-                await pilot.pause()
+                await app.workers.wait_for_complete()
                 mock_copy.assert_called_once_with('You are a helpful assistant.')
 
     @pytest.mark.asyncio
@@ -173,9 +173,47 @@ class TestDetailScreen:
 
             with patch('pyperclip.copy') as mock_copy:
                 await pilot.press('u')
-                await pilot.pause()
+                await app.workers.wait_for_complete()
                 mock_copy.assert_called_once_with('Please help with {task}')
 
+    @pytest.mark.asyncio
+    async def test_detail_copy_uses_shown_prompt(self, mock_storage, monkeypatch):
+        """Test that copying uses the prompt on screen instead of reading storage again."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            app.push_screen(DetailScreen(mock_storage, 'test-prompt', prompt_group='testing'))
+            await pilot.pause()
+
+            def fail(*args, **kwargs):
+                raise AssertionError('prompt was read again')
+
+            monkeypatch.setattr(mock_storage, 'read', fail)
+            with patch('pyperclip.copy') as mock_copy:
+                await pilot.press('c')
+                await app.workers.wait_for_complete()
+                await pilot.press('u')
+                await app.workers.wait_for_complete()
+                assert [call.args[0] for call in mock_copy.call_args_list] == [
+                    'You are a helpful assistant.',
+                    'Please help with {task}',
+                ]
+
+    @pytest.mark.asyncio
+    async def test_detail_copy_failure_is_reported(self, mock_storage):
+        """Test that a clipboard error from the copy worker shows an error notification."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            app.push_screen(DetailScreen(mock_storage, 'test-prompt'))
+            await pilot.pause()
+            notices = []
+            app.screen.notify = lambda message, **kwargs: notices.append((message, kwargs.get('severity')))
+
+            with patch('pyperclip.copy', side_effect=RuntimeError('no clipboard')):
+                await pilot.press('c')
+                await app.workers.wait_for_complete()
+
+            assert notices == [('Failed to copy to clipboard', 'error')]
+
     @pytest.mark.asyncio
     async def test_detail_handles_missing_prompt(self, mock_storage):
         """Test that detail screen handles non-existent prompt gracefully."""
@@ -203,3 +241,36 @@ class TestDetailScreen:
             assert 'Description: A test prompt for testing' in detail_text
             assert 'Group: testing' in detail_text
             assert 'Tags: test, example' in detail_text
+
+    @pytest.mark.asyncio
+    async def test_detail_reload_updates_widgets_in_place(self, mock_storage):
+        """Test that reloading after an edit reuses the section widgets and hides empty ones."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            app.push_screen(DetailScreen(mock_storage, 'test-prompt', prompt_group='testing'))
+            await pilot.pause()
+            screen = app.screen
+            before = list(screen.query_one('#detail-container').children)
+
+            edited = Prompt(name='test-prompt', system_prompt='Edited system', group='testing')
+            mock_storage.update('test-prompt', edited, 'testing')
+            screen.refresh_after_save(edited)
+            await pilot.pause()
+
+            assert list(screen.query_one('#detail-container').children) == before
+            assert screen.query_one('#system-content').renderable == 'Edited system'
+            assert str(screen.query_one('#detail-meta').renderable) == 'Group: testing'
+            assert not screen.query_one('#user-title').display
+            assert not screen.query_one('#user-content').display
+            assert not screen.query_one('#detail-missing').display
+
+    @pytest.mark.asyncio
+    async def test_detail_missing_prompt_hides_sections(self, mock_storage):
+        """Test that only the not-found message shows for a missing prompt."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            app.push_screen(DetailScreen(mock_storage, 'nonexistent'))
+            await pilot.pause()
+
+            shown = [widget.id for widget in app.screen.query_one('#detail-container').children if widget.display]
+            assert shown == ['detail-title', 'detail-missing']
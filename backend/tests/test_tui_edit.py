@@ -34,6 +34,27 @@ async def test_add_prompt_saves_and_closes(tmp_path):
         assert isinstance(app.screen, HomeScreen)
 
 
+@pytest.mark.asyncio
+async def test_save_splits_and_trims_tags(tmp_path):
+    """Test that the tags field is split on commas with surrounding whitespace and empties dropped."""
+    storage = PromptStorage(prompts_dir=tmp_path / 'prompts')
+    app = PromptButlerApp(storage=storage)
+
+    async with app.run_test() as pilot:
+        app.push_screen(AddEditScreen(storage))
+        await pilot.pause()
+
+        screen = app.screen
+        screen.query_one('#name-input', Input).value = 'tagged'
+        screen.query_one('#tags-input', Input).value = '  alpha ,, two words ,beta , '
+        screen.query_one('#system-prompt-input', TextArea).text = 'System prompt'
+
+        await pilot.press('ctrl+s')
+        await pilot.pause()
+
+        assert storage.read('tagged').tags == ['alpha', 'two words', 'beta']
+
+
 @pytest.mark.asyncio
 async def test_cancel_discards_changes(tmp_path):
     """Test that cancel exits without saving."""
@@ -113,6 +134,58 @@ async def test_tag_autocomplete_shows_matches(tmp_path):
         assert len(suggestions.children) > 0
 
 
+@pytest.mark.asyncio
+async def test_unchanged_suggestions_are_not_rebuilt(tmp_path):
+    """Test that typing on without changing the matches keeps the suggestion items."""
+    storage = PromptStorage(prompts_dir=tmp_path / 'prompts')
+    storage.create(Prompt(name='tagged-prompt', system_prompt='System', tags=['alpha', 'Alpine', 'beta']))
+
+    app = PromptButlerApp(storage=storage)
+    async with app.run_test() as pilot:
+        app.push_screen(AddEditScreen(storage))
+        await pilot.pause()
+
+        screen = app.screen
+        tags_input = screen.query_one('#tags-input', Input)
+        suggestions = screen.query_one('#tag-suggestions', ListView)
+        tags_input.value = 'AL'
+        await pilot.pause()
+        items = list(suggestions.children)
+        assert len(items) == 2
+
+        tags_input.value = 'al '
+        await pilot.pause()
+        assert list(suggestions.children) == items
+
+        tags_input.value = 'alpha, al'
+        await pilot.pause()
+        assert len(suggestions.children) == 1
+        assert suggestions.has_class('-visible')
+
+        tags_input.value = 'alpha, zzz'
+        await pilot.pause()
+        assert not suggestions.has_class('-visible')
+
+
+@pytest.mark.asyncio
+async def test_group_suggestions_show_first_five_matches(tmp_path):
+    """Test that only the first five matching groups are suggested, in order."""
+    storage = PromptStorage(prompts_dir=tmp_path / 'prompts')
+    groups = [f'team-{i}' for i in range(8)]
+
+    app = PromptButlerApp(storage=storage)
+    async with app.run_test() as pilot:
+        app.push_screen(AddEditScreen(storage, existing_tags=[], existing_groups=['other', *groups]))
+        await pilot.pause()
+
+        screen = app.screen
+        screen.query_one('#group-input', Input).value = 'TEAM'
+        await pilot.pause()
+
+        suggestions = screen.query_one('#group-suggestions', ListView)
+        assert [str(item.query_one('Label').render()) for item in suggestions.children] == groups[:5]
+
+
 @pytest.mark.asyncio
 async def test_edit_prompt_updates_group(tmp_path):
     """Test that editing a prompt can move it to a new group."""
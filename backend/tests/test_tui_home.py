@@ -0,0 +1,409 @@
+"""Tests for TUI HomeScreen."""
+
+import pytest
+from textual.coordinate import Coordinate
+from textual.widgets import DataTable, Input, Label, ListItem, ListView, TextArea
+
+from prompt_butler.models import Prompt
+from prompt_butler.services.storage import PromptStorage
+from prompt_butler.tui.app import SEARCH_DEBOUNCE_SECONDS, PromptButlerApp
+
+
+@pytest.fixture
+def mock_storage(tmp_path):
+    """Create a storage with test prompts."""
+    prompts_dir = tmp_path / 'prompts'
+    prompts_dir.mkdir()
+    storage = PromptStorage(prompts_dir=prompts_dir)
+
+    storage.create(
+        Prompt(
+            name='code-review',
+            description='Reviews Python code',
+            system_prompt='You review code.',
+            group='coding',
+            tags=['python', 'review'],
+        )
+    )
+    storage.create(
+        Prompt(
+            name='poem-writer',
+            description='Writes short poems',
+            system_prompt='You write poems.',
+            tags=['Creative'],
+        )
+    )
+
+    return storage
+
+
+def _row_keys(app: PromptButlerApp) -> list[str]:
+    table = app.screen.query_one('#prompt-list', DataTable)
+    return [str(row.key.value) for row in table.ordered_rows]
+
+
+class TestHomeScreenSearch:
+    @pytest.mark.asyncio
+    async def test_search_matches_name_description_and_tags(self, mock_storage):
+        """Test that the search box filters on name, description and tags, ignoring case."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert _row_keys(app) == ['poem-writer', 'coding/code-review']
+
+            search_input = app.screen.query_one('#search-input', Input)
+            for query, expected in [
+                ('REVIEW', ['coding/code-review']),
+                ('short poems', ['poem-writer']),
+                ('creative', ['poem-writer']),
+                ('nothing-matches', []),
+            ]:
+                search_input.value = query
+                await pilot.pause(SEARCH_DEBOUNCE_SECONDS * 3)
+                assert _row_keys(app) == expected, query
+
+    @pytest.mark.asyncio
+    async def test_search_ignores_unicode_case(self, mock_storage):
+        """Test that the search compares casefolded text, so 'STRASSE' finds 'straße'."""
+        mock_storage.create(Prompt(name='street', description='Die straße', system_prompt='S'))
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            screen.search_query = 'STRASSE'
+            screen.update_table()
+
+            assert _row_keys(app) == ['street']
+
+    @pytest.mark.asyncio
+    async def test_search_combines_with_group_filter(self, mock_storage):
+        """Test that the search runs on top of the selected group."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.screen.selected_group = '(root)'
+            app.screen.query_one('#search-input', Input).value = 'r'
+            await pilot.pause(SEARCH_DEBOUNCE_SECONDS * 3)
+
+            assert _row_keys(app) == ['poem-writer']
+
+    @pytest.mark.asyncio
+    async def test_refining_and_widening_the_query(self, mock_storage):
+        """Test that extending, shortening and re-filtering a query all give full results."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+
+            for group, query, expected in [
+                ('', 'e', ['poem-writer', 'coding/code-review']),
+                ('', 'ev', ['coding/code-review']),
+                ('', 'e', ['poem-writer', 'coding/code-review']),
+                ('(root)', 'e', ['poem-writer']),
+                ('', 'e', ['poem-writer', 'coding/code-review']),
+            ]:
+                screen.selected_group = group
+                screen.search_query = query
+                screen.update_table()
+                assert _row_keys(app) == expected, (group, query)
+
+            mock_storage.create(Prompt(name='essay', system_prompt='S'))
+            screen.load_prompts()
+            assert _row_keys(app) == ['essay', 'poem-writer', 'coding/code-review']
+
+    @pytest.mark.asyncio
+    async def test_search_waits_for_typing_to_pause(self, mock_storage, monkeypatch):
+        """Test that a burst of keystrokes filters the table once, after the debounce."""
+        # Long enough that the key presses below always land inside one debounce window
+        monkeypatch.setattr('prompt_butler.tui.app.SEARCH_DEBOUNCE_SECONDS', 0.5)
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            updates = []
+            real_update = screen.update_table
+            screen.update_table = lambda: updates.append(screen.search_query) or real_update()
+
+            await pilot.press('/', 'p', 'o', 'e', 'm')
+            assert updates == []
+
+            await pilot.pause(1.0)
+            assert updates == ['poem']
+            assert _row_keys(app) == ['poem-writer']
+
+    @pytest.mark.asyncio
+    async def test_unchanged_search_value_schedules_nothing(self, mock_storage):
+        """Test that clearing the search doesn't queue a second, debounced filter pass."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            screen.query_one('#search-input', Input).value = 'poem'
+            await pilot.pause(SEARCH_DEBOUNCE_SECONDS * 3)
+
+            screen.action_clear_search()
+            await pilot.pause()
+
+            assert screen._search_timer is None
+            assert _row_keys(app) == ['poem-writer', 'coding/code-review']
+
+
+class TestHomeScreenTable:
+    @pytest.mark.asyncio
+    async def test_rows_show_truncated_description_and_tags(self, mock_storage):
+        """Test the cells shown for each prompt."""
+        mock_storage.create(Prompt(name='long', description='x' * 50, system_prompt='S'))
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            table = app.screen.query_one('#prompt-list', DataTable)
+
+            assert table.get_row('long') == ['long', '(root)', 'x' * 37 + '...', '']
+            assert table.get_row('coding/code-review') == [
+                'code-review',
+                'coding',
+                'Reviews Python code',
+                'python, review',
+            ]
+
+    @pytest.mark.asyncio
+    async def test_narrowing_and_widening_keep_list_order(self, mock_storage):
+        """Test that rows removed in place and rows added back keep the list order."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+
+            screen.search_query = 'review'
+            screen.update_table()
+            assert _row_keys(app) == ['coding/code-review']
+
+            screen.search_query = ''
+            screen.update_table()
+            assert _row_keys(app) == ['poem-writer', 'coding/code-review']
+
+    @pytest.mark.asyncio
+    async def test_unchanged_results_leave_table_alone(self, mock_storage):
+        """Test that a filter pass with the same results doesn't rebuild the table."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            table = screen.query_one('#prompt-list', DataTable)
+            table.cursor_coordinate = Coordinate(1, 0)
+            clears = []
+            real_clear = table.clear
+            table.clear = lambda *args, **kwargs: clears.append(args) or real_clear(*args, **kwargs)
+
+            screen.search_query = 'e'
+            screen.update_table()
+
+            assert clears == []
+            assert table.cursor_coordinate.row == 1
+
+            screen.load_prompts()
+            assert len(clears) == 1
+
+
+class TestHomeScreenFilters:
+    @pytest.mark.asyncio
+    async def test_group_and_tag_filters(self, mock_storage):
+        """Test group and tag filters on their own and combined."""
+        mock_storage.create(Prompt(name='linter', system_prompt='S', group='coding', tags=['python']))
+        mock_storage.create(Prompt(name='snake-poem', system_prompt='S', tags=['python', 'python']))
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+
+            for group, tag, expected in [
+                ('coding', '', ['coding/code-review', 'coding/linter']),
+                ('(root)', '', ['poem-writer', 'snake-poem']),
+                ('', 'python', ['snake-poem', 'coding/code-review', 'coding/linter']),
+                ('coding', 'review', ['coding/code-review']),
+                ('missing', '', []),
+                ('', 'missing', []),
+            ]:
+                screen.selected_group = group
+                screen.selected_tag = tag
+                screen.update_table()
+                assert _row_keys(app) == expected, (group, tag)
+
+    @pytest.mark.asyncio
+    async def test_cycling_filters_wraps_and_recovers(self, mock_storage):
+        """Test that g/t step through every value, wrap to All, and reset a value that's gone."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+
+            seen = []
+            for _ in range(4):
+                screen.action_cycle_tag_filter()
+                seen.append(screen.selected_tag)
+            assert seen == ['Creative', 'python', 'review', '']
+
+            screen.selected_group = 'deleted-group'
+            screen.action_cycle_group_filter()
+            assert screen.selected_group == ''
+
+
+class TestHomeScreenSidebar:
+    @pytest.mark.asyncio
+    async def test_refresh_reuses_items_and_keeps_order(self, mock_storage):
+        """Test that refreshing the sidebar only mounts new entries and relabels changed counts."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            tag_list = screen.query_one('#tag-list', ListView)
+            before = {item.id: item for item in tag_list.query(ListItem)}
+
+            mock_storage.create(Prompt(name='linter', system_prompt='S', tags=['lint', 'python']))
+            screen.action_refresh()
+            await pilot.pause()
+
+            items = list(tag_list.query(ListItem))
+            labels = [str(item.query_one(Label).render()) for item in items]
+            assert labels == ['All', 'Creative (1)', 'lint (1)', 'python (2)', 'review (1)']
+            assert all(before[item.id] is item for item in items if item.id in before)
+            assert len(items) == len(before) + 1
+
+            mock_storage.delete('linter')
+            screen.action_refresh()
+            await pilot.pause()
+
+            labels = [str(item.query_one(Label).render()) for item in tag_list.query(ListItem)]
+            assert labels == ['All', 'Creative (1)', 'python (1)', 'review (1)']
+
+    @pytest.mark.asyncio
+    async def test_new_entries_are_mounted_in_batches(self, mock_storage):
+        """Test that adjacent new sidebar entries are mounted together, in order."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            tag_list = screen.query_one('#tag-list', ListView)
+            mounts = []
+            real_mount = tag_list.mount
+            tag_list.mount = lambda *widgets, **kwargs: mounts.append(len(widgets)) or real_mount(*widgets, **kwargs)
+
+            mock_storage.create(Prompt(name='linter', system_prompt='S', tags=['lint', 'llm', 'zz-top']))
+            screen.action_refresh()
+            await pilot.pause()
+
+            labels = [str(item.query_one(Label).render()) for item in tag_list.query(ListItem)]
+            assert labels == ['All', 'Creative (1)', 'lint (1)', 'llm (1)', 'python (1)', 'review (1)', 'zz-top (1)']
+            assert sorted(mounts) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_filters_and_add_screen_use_loaded_prompts(self, mock_storage, monkeypatch):
+        """Test that cycling filters and opening the add screen don't rescan storage."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+
+            def fail(*args, **kwargs):
+                raise AssertionError('storage was rescanned')
+
+            for method in ('stats', 'get_all_groups', 'get_all_tags'):
+                monkeypatch.setattr(mock_storage, method, fail)
+
+            screen.action_cycle_group_filter()
+            assert screen.selected_group == 'coding'
+            screen.action_cycle_group_filter()
+            assert screen.selected_group == ''
+            screen.action_cycle_tag_filter()
+            assert screen.selected_tag == 'Creative'
+
+            screen.action_add_prompt()
+            await pilot.pause()
+            assert app.screen.existing_groups == ['coding']
+            assert app.screen.existing_tags == ['Creative', 'python', 'review']
+
+    @pytest.mark.asyncio
+    async def test_edit_from_detail_uses_loaded_prompts(self, mock_storage, monkeypatch):
+        """Test that editing from a detail screen opened here doesn't rescan storage."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            monkeypatch.setattr(mock_storage, 'stats', lambda: pytest.fail('storage was rescanned'))
+
+            app.screen.action_view_prompt()
+            await pilot.pause()
+            app.screen.action_edit_prompt()
+            await pilot.pause()
+
+            assert app.screen.existing_groups == ['coding']
+            assert app.screen.existing_tags == ['Creative', 'python', 'review']
+
+
+    @pytest.mark.asyncio
+    async def test_second_edit_from_detail_sees_tags_added_by_first(self, mock_storage):
+        """Test that saving from a detail screen refreshes the lists its next edit suggests."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.screen._show_detail('poem-writer')
+            await pilot.pause()
+            detail = app.screen
+
+            detail.action_edit_prompt()
+            await pilot.pause()
+            app.screen.query_one('#group-input', Input).value = 'writing'
+            app.screen.query_one('#tags-input', Input).value = 'Creative, verse'
+            app.screen.action_save()
+            await pilot.pause()
+            assert app.screen is detail
+
+            detail.action_edit_prompt()
+            await pilot.pause()
+
+            assert app.screen.existing_groups == ['coding', 'writing']
+            assert 'verse' in app.screen.existing_tags
+
+class TestHomeScreenReload:
+    @pytest.mark.asyncio
+    async def test_refresh_skips_unchanged_sidebar(self, mock_storage):
+        """Test that a refresh leaves the sidebar alone when groups and tags are unchanged."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            synced = []
+            real_sync = screen._sync_filter_list
+            screen._sync_filter_list = lambda *args: synced.append(args[0].id) or real_sync(*args)
+
+            mock_storage.update(
+                'poem-writer',
+                Prompt(name='poem-writer', description='Edited', system_prompt='S', tags=['Creative']),
+            )
+            screen.action_refresh()
+            assert synced == []
+
+            mock_storage.create(Prompt(name='new-one', system_prompt='S', group='writing'))
+            screen.action_refresh()
+            assert synced == ['group-list', 'tag-list']
+
+    @pytest.mark.asyncio
+    async def test_adding_a_prompt_updates_sidebar(self, mock_storage):
+        """Test that saving from the add screen refreshes the table and the sidebar."""
+        app = PromptButlerApp(storage=mock_storage)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            screen.action_add_prompt()
+            await pilot.pause()
+
+            add_screen = app.screen
+            add_screen.query_one('#name-input', Input).value = 'fresh'
+            add_screen.query_one('#tags-input', Input).value = 'brand-new'
+            add_screen.query_one('#system-prompt-input', TextArea).text = 'System'
+            await pilot.press('ctrl+s')
+            await pilot.pause()
+
+            assert app.screen is screen
+            assert 'fresh' in _row_keys(app)
+            tag_list = screen.query_one('#tag-list', ListView)
+            assert any(str(item.query_one(Label).render()) == 'brand-new (1)' for item in tag_list.query(ListItem))